@@ -5,11 +5,27 @@
 
 from .validation import check_null_empty
 from .validation import field_apply_list
+from .validation import build_checks
+from .validation import save_result
+from .validation import check_structure
 from .validation import check_values_list
 from .validation import check_regex_format
 from .validation import check_zero_values
 from .validation import check_negative_values
 from .validation import check_valid_range
+from .profiling import profile_numeric_columns
+from .profiling import clear_profile_cache
+from .profiling import check_iqr_outliers
+from .profiling import check_zscore_outliers
+from .profiling import check_skewness
+from .profiling import check_kurtosis
+from .profiling import check_quantiles
+from .profiling import check_correlation
+from .profiling import check_covariance
+from .parallel import validate_file_parallel
 
-__all__ = ["check_null_empty", "field_apply_list", "check_values_list", 
-           "check_regex_format", "check_zero_values","check_negative_values","check_valid_range"]
\ No newline at end of file
+__all__ = ["check_null_empty", "field_apply_list", "build_checks", "save_result", "check_structure", "check_values_list", 
+           "check_regex_format", "check_zero_values","check_negative_values","check_valid_range",
+           "profile_numeric_columns", "clear_profile_cache", "check_iqr_outliers", "check_zscore_outliers", "check_skewness",
+           "check_kurtosis", "check_quantiles", "check_correlation", "check_covariance",
+           "validate_file_parallel"]
\ No newline at end of file
@@ -0,0 +1,293 @@
+# ============================================================
+#  File:        parallel.py
+#  Author:      Sergio Ribeiro
+#  Description: Validação de um arquivo grande em paralelo, por faixas de bytes
+# ============================================================
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, Series
+
+from src.analisys import validation
+from src.analisys.validation import PARTIAL_CHECKS, build_checks, check_structure, save_result
+from src.analisys.profiling import PROFILE_CHECKS, ORDER_STAT_CHECKS, run_profile_check
+from src.analisys.profiling import numeric_matrix, moments_partial, select_moments, merge_moments, finish_profile
+from src.utilities.splitter import split_byte_ranges, read_byte_range
+from src.utilities.utilities import detect_encoding, prepare_data
+
+
+# Rotinas auxiliares
+
+def _column_types(df_data: DataFrame) -> Optional[Dict[str, Tuple[str, bool]]]:
+    # Tipo inferido pelo pandas para cada coluna da faixa e se todos os valores são
+    # inteiros (None para uma faixa sem registros, que não indica o tipo das colunas)
+    if len(df_data) == 0:
+        return None
+    types = {}
+    for col in df_data.columns:
+        serie = df_data[col]
+        if serie.dtype.kind == "f":
+            integral = bool((serie.dropna() % 1 == 0).all())
+        else:
+            integral = serie.dtype.kind == "i"
+        types[col] = (str(serie.dtype), integral)
+    return types
+
+
+def _resolve_types(range_types: List[Optional[Dict[str, Tuple[str, bool]]]]) -> Dict[str, Tuple[str, bool]]:
+    # ----------------------------------------------------------------------------------
+    # Combina os tipos das faixas com a mesma regra da leitura do arquivo inteiro:
+    # texto em qualquer faixa -> texto; inteiro e float -> float; o float so vira
+    # "Int64" se todos os valores forem inteiros em todas as faixas
+    # ----------------------------------------------------------------------------------
+    com_registros = [types for types in range_types if types is not None]
+    resolved = {}
+    for col in (com_registros[0] if com_registros else {}):
+        kinds = set(types[col][0] for types in com_registros)
+        if len(kinds) == 1:
+            base = kinds.pop()
+        elif kinds <= {"int64", "float64"}:
+            base = "float64"
+        else:
+            base = "object"
+        resolved[col] = (base, all(types[col][1] for types in com_registros))
+    return resolved
+
+
+def _final_dtypes(types: Optional[Dict[str, Tuple[str, bool]]]) -> Optional[Dict[str, str]]:
+    # Tipo de cada coluna após prepare_data
+    if types is None:
+        return None
+    return {col: "Int64" if base == "float64" and integral else base for col, (base, integral) in types.items()}
+
+
+def _same_types(local: Optional[Dict[str, str]], resolved: Dict[str, str]) -> bool:
+    # ----------------------------------------------------------------------------------
+    # Indica se a faixa pode ser mantida com os tipos inferidos nela. "int64" e "Int64"
+    # são equivalentes (as contagens e o perfil são os mesmos): so refaz a faixa quando
+    # o tipo realmente muda (texto x numero, inteiro x float com decimais).
+    # ----------------------------------------------------------------------------------
+    if local is None:
+        return False
+    inteiro = {"int64": "Int64"}
+    return {col: inteiro.get(dtype, dtype) for col, dtype in local.items()} == \
+        {col: inteiro.get(dtype, dtype) for col, dtype in resolved.items()}
+
+
+def _validate_range(byte_range: Tuple[int, int], file_path: str, header_end: int, separator: str,
+                    encoding: str, df_fields: DataFrame, checks: List[Tuple[Series, str]],
+                    with_profile: bool, order_columns: List[str], dtypes: Optional[Dict[str, str]] = None,
+                    read_dtypes: Optional[Dict[str, str]] = None) -> Tuple[int, list, Any, Any]:
+    # ----------------------------------------------------------------------------------
+    # Lê e valida uma faixa do arquivo (executada em um processo separado)
+    # Sem dtypes, os tipos são inferidos na faixa e devolvidos para conferência; com
+    # dtypes, a faixa é lida com os tipos definidos para o arquivo inteiro
+    # ----------------------------------------------------------------------------------
+    start, end = byte_range
+    df_data = read_byte_range(file_path, header_end, start, end, separator, encoding, dtype=read_dtypes)
+    df_data.columns = df_data.columns.str.strip().str.lower()
+    types = _column_types(df_data) if dtypes is None else None
+    df_data = prepare_data(df_data, dtypes)
+
+    partials = []
+    for row, routine in checks:
+        try:
+            partial_fn, _ = PARTIAL_CHECKS[routine]
+            partials.append(partial_fn(df_data, df_fields, row))
+        except Exception:
+            # Em caso de falha, a propria rotina gera a mensagem de erro padrão
+            try:
+                partials.append(getattr(validation, routine)(df_data, df_fields, row))
+            except Exception as e:
+                partials.append(("Falha na chamada da rotina de analise", "error",
+                                 f"Rotina '{routine}': {type(e).__name__}: {str(e)}"))
+
+    # Perfil estatistico da faixa: somas parciais das colunas numericas e os valores
+    # somente das colunas que precisam de quantis (order_columns)
+    numeric = None
+    if with_profile:
+        columns, matrix = numeric_matrix(df_data)
+        values = {col: np.ascontiguousarray(matrix[:, columns.index(col)]) for col in order_columns if col in columns}
+        numeric = (columns, moments_partial(matrix), values)
+
+    return len(df_data), partials, numeric, types
+
+
+def _merge_partials(partials: list, offsets: List[int]) -> Any:
+    # ----------------------------------------------------------------------------------
+    # Soma as contagens parciais das faixas e converte a primeira ocorrencia de erro
+    # para o indice do arquivo inteiro
+    # ----------------------------------------------------------------------------------
+    # Retorno definitivo (erro ou parametro invalido) da primeira faixa que o gerou
+    for item in partials:
+        if isinstance(item, tuple):
+            return item
+
+    merged: Dict[str, Any] = {"first_index": None, "first_value": None}
+    for item, offset in zip(partials, offsets):
+        for key, value in item.items():
+            if not key.startswith("first_"):
+                merged[key] = merged.get(key, 0) + value
+        if merged["first_index"] is None and item.get("first_index") is not None:
+            merged["first_index"] = item["first_index"] + offset
+            merged["first_value"] = item["first_value"]
+    return merged
+
+
+def _merge_profile(numerics: List[Tuple[list, Dict[str, np.ndarray], Dict[str, np.ndarray]]],
+                   order_columns: List[str]) -> Dict[str, Any]:
+    # ----------------------------------------------------------------------------------
+    # Agrega as somas parciais das faixas e calcula o perfil do arquivo inteiro; os
+    # quantis e outliers são calculados so para as colunas de order_columns
+    # ----------------------------------------------------------------------------------
+    # So são numericas as colunas numericas em todas as faixas
+    columns = [col for col in numerics[0][0] if all(col in cols for cols, _, _ in numerics[1:])]
+    moments = None
+    for cols, partial_moments, _ in numerics:
+        partial_moments = select_moments(partial_moments, [cols.index(col) for col in columns])
+        moments = partial_moments if moments is None else merge_moments(moments, partial_moments)
+
+    order_columns = [col for col in dict.fromkeys(order_columns) if col in columns]
+    if order_columns:
+        matrix = np.column_stack([np.concatenate([values[col] for _, _, values in numerics]) for col in order_columns])
+    else:
+        matrix = np.empty((0, 0), dtype=np.float64)
+
+    return finish_profile(columns, moments, order_columns, matrix, pd.RangeIndex(len(matrix)))
+
+
+# Rotina principal
+
+def validate_file_parallel(file_path: str, df_fields: DataFrame, df_validations: Optional[DataFrame], separator: str,
+                           encode: str = "", max_workers: Optional[int] = None, n_parts: Optional[int] = None,
+                           checks: Optional[List[Tuple[Series, Series]]] = None) -> List[Dict[str, Any]]:
+    """
+    Valida um arquivo CSV grande em paralelo: o arquivo é dividido em faixas de bytes
+    alinhadas ao fim dos registros, cada faixa é lida e validada em um processo separado
+    com as mesmas rotinas de validação e as contagens parciais são somadas ao final.
+    Os exemplos de erro apontam a linha no arquivo inteiro.
+
+    Os tipos das colunas são os mesmos da leitura do arquivo inteiro: cada faixa informa
+    os tipos inferidos nos seus registros e as faixas com tipo diferente do arquivo
+    inteiro são validadas de novo com os tipos combinados.
+
+    As rotinas com contagem parcial (PARTIAL_CHECKS) são executadas em cada faixa. Para
+    as rotinas de perfil (PROFILE_CHECKS) cada faixa devolve as somas parciais (momentos
+    e produtos cruzados) das colunas numericas, agregadas no processo principal; apenas
+    os valores dos campos com checagem de quantis ou outliers (ORDER_STAT_CHECKS) são
+    trazidos inteiros. As demais são registradas com status "error".
+
+    Args:
+        file_path: Caminho do arquivo CSV.
+        df_fields: Campos configurados (aba 'fields'). Sem checks, já filtrada pelo arquivo.
+        df_validations: Lista de validações (aba 'validations'), não usada se checks for informado.
+        separator: Separador de campos.
+        encode: Encode do arquivo (vazio para detectar).
+        max_workers: Quantidade de processos (padrão: numero de CPUs).
+        n_parts: Quantidade de faixas (padrão: igual a max_workers).
+        checks: Lista (campo, checagem) já montada com build_checks (padrão: montada
+            a partir de df_fields e df_validations).
+
+    Returns:
+        A lista de resultados no formato do relatório
+        (file, Field, category, test, evidence, detail, status), iniciada pelas
+        informações de estrutura do arquivo (check_structure).
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    n_parts = n_parts or max_workers
+
+    # Detecta por amostras do arquivo (a leitura é feita por faixas, em paralelo)
+    encoding = detect_encoding(file_path, encode, sample=True)
+    header_end, ranges = split_byte_ranges(file_path, n_parts)
+
+    # Colunas do arquivo (somente o cabeçalho)
+    header = read_byte_range(file_path, header_end, header_end, header_end, separator, encoding).columns.to_list()
+    columns = [str(col).strip().lower() for col in header]
+    if checks is None:
+        checks = build_checks(df_fields, df_validations, columns)
+    else:
+        # ignora colunas que não foram encontradas
+        checks = [(row, check_row) for row, check_row in checks if str(row["field"]).strip().lower() in columns]
+
+    # Separa as checagens que podem ser executadas por faixa
+    partial_checks = [(row, check_row["routine"]) for row, check_row in checks if check_row["routine"] in PARTIAL_CHECKS]
+    with_profile = any(check_row["routine"] in PROFILE_CHECKS for _, check_row in checks)
+    order_columns = [str(row["field"]).strip().lower() for row, check_row in checks if check_row["routine"] in ORDER_STAT_CHECKS]
+
+    record_counts = []
+    range_partials = []
+    range_numerics = []
+    if ranges:
+        worker = partial(_validate_range, file_path=file_path, header_end=header_end, separator=separator,
+                         encoding=encoding, df_fields=df_fields, checks=partial_checks, with_profile=with_profile,
+                         order_columns=order_columns)
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(ranges))) as executor:
+            range_types = []
+            for count, partials, numeric, types in executor.map(worker, ranges):
+                record_counts.append(count)
+                range_partials.append(partials)
+                range_numerics.append(numeric)
+                range_types.append(types)
+
+            # Cada faixa infere os tipos so com os seus valores (ex: uma coluna com texto
+            # apenas no fim do arquivo). As faixas cujo tipo difere do tipo do arquivo
+            # inteiro são lidas e validadas de novo com os tipos do arquivo inteiro.
+            dtypes = _final_dtypes(_resolve_types(range_types))
+            refazer = [i for i, types in enumerate(range_types) if not _same_types(_final_dtypes(types), dtypes)]
+            if refazer:
+                read_dtypes = {raw: "object" for raw, col in zip(header, columns) if dtypes.get(col) == "object"}
+                worker = partial(worker, dtypes=dtypes, read_dtypes=read_dtypes or None)
+                for i, (count, partials, numeric, _) in zip(refazer, executor.map(worker, [ranges[i] for i in refazer])):
+                    record_counts[i] = count
+                    range_partials[i] = partials
+                    range_numerics[i] = numeric
+
+    profile = None
+    if with_profile:
+        try:
+            if range_numerics:
+                profile = _merge_profile(range_numerics, order_columns)
+            else:
+                empty_columns, matrix = numeric_matrix(pd.DataFrame(columns=columns))
+                profile = finish_profile(empty_columns, moments_partial(matrix), empty_columns, matrix, pd.RangeIndex(0))
+        except Exception as e:
+            profile = e
+
+    # Indice inicial de cada faixa no arquivo inteiro
+    offsets = [sum(record_counts[:i]) for i in range(len(record_counts))]
+
+    # Informações de estrutura (tamanho, colunas faltantes e duplicadas)
+    results = check_structure(file_path, sum(record_counts), columns, df_fields)
+    position = 0
+    for row, check_row in checks:
+        routine = check_row["routine"]
+        if routine in PROFILE_CHECKS:
+            if isinstance(profile, Exception):
+                evidence, status, detail = ("Erro na rotina de analise.", "error",
+                                            f"FALHA INESPERADA na rotina {routine}: {type(profile).__name__}: {str(profile)}")
+            else:
+                evidence, status, detail = run_profile_check(routine, profile, columns, row)
+        elif routine not in PARTIAL_CHECKS:
+            evidence, status, detail = ("Não foi possivel validar", "error",
+                                        f"Rotina '{routine}' não suporta validação paralela por faixas do arquivo.")
+        else:
+            partial_fn, format_fn = PARTIAL_CHECKS[routine]
+            try:
+                if range_partials:
+                    merged = _merge_partials([partials[position] for partials in range_partials], offsets)
+                else:
+                    # Arquivo sem registros: mesma contagem de um DataFrame vazio
+                    merged = partial_fn(pd.DataFrame(columns=columns), df_fields, row)
+                evidence, status, detail = merged if isinstance(merged, tuple) else format_fn(merged, row)
+            except Exception as e:
+                evidence, status, detail = ("Falha na chamada da rotina de analise", "error",
+                                            f"Rotina '{routine}': {type(e).__name__}: {str(e)}")
+            position += 1
+
+        results.append(save_result(row["file"], row["field"], check_row["category"], check_row["test"], evidence, detail, status))
+
+    return results
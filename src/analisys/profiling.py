@@ -0,0 +1,559 @@
+# ============================================================
+#  File:        profiling.py
+#  Author:      Sergio Ribeiro
+#  Description: Perfil estatistico e outliers das colunas numericas
+# ============================================================
+import weakref
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, Series
+from typing import Dict, Any, Tuple, Optional
+
+# Limites padrão das checagens de outliers
+IQR_FACTOR = 1.5
+ZSCORE_LIMIT = 3.0
+QUANTILES = (0.01, 0.25, 0.50, 0.75, 0.99)
+
+# Cache do ultimo perfil calculado. O notebook valida campo a campo, mas todas as
+# colunas de um arquivo são processadas de uma vez, entao o perfil so é refeito
+# quando muda o DataFrame carregado. A referencia ao DataFrame é fraca (não o mantém
+# em memória) e alterações nos valores sem mudar o formato não são detectadas: o
+# cache deve ser limpo ao fim de cada arquivo (clear_profile_cache).
+_PROFILE_CACHE: Dict[str, Any] = {"df": None, "key": None, "profile": None}
+
+
+# Rotinas auxiliares
+
+def numeric_matrix(df_data: DataFrame) -> Tuple[list, np.ndarray]:
+    """
+    Empilha as colunas numericas do arquivo em uma matriz 2D (linhas x colunas).
+    As colunas sem nenhum valor preenchido são mantidas (uma faixa do arquivo pode ter
+    a coluna toda vazia); finish_profile as separa do perfil.
+
+    Args:
+        df_data: O DataFrame Pandas contendo os dados do arquivo.
+
+    Returns:
+        Uma tupla contendo: (nomes das colunas, matriz float64 com NaN nos nulos)
+    """
+    columns = []
+    arrays = []
+    for col in df_data.columns:
+        serie = df_data[col]
+        if pd.api.types.is_numeric_dtype(serie) and not pd.api.types.is_bool_dtype(serie):
+            numerica = pd.to_numeric(serie, errors='coerce')
+        else:
+            # padroniza virgula para separador decimal (mesma regra das demais checagens)
+            texto = serie.astype(str).str.strip()
+            numerica = pd.to_numeric(texto.str.replace(',', '.', regex=False), errors='coerce')
+            # So considera numerica a coluna em que todos os valores preenchidos convertem
+            preenchidos = serie.notna() & texto.ne('')
+            if (numerica.notna() != preenchidos).any():
+                continue
+        columns.append(col)
+        arrays.append(numerica.to_numpy(dtype=np.float64, na_value=np.nan))
+
+    if not arrays:
+        return columns, np.empty((len(df_data), 0), dtype=np.float64)
+
+    # Matriz contigua em ordem de coluna: cada coluna é lida sequencialmente nas reduções
+    return columns, np.asfortranarray(np.column_stack(arrays))
+
+
+def moments_partial(matrix: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Calcula as somas parciais das colunas da matriz, que podem ser agregadas entre
+    partes do arquivo com merge_moments: por coluna, quantidade, media e somas dos
+    desvios ao quadrado, cubo e quarta potencia; por par de colunas (i, j), os mesmos
+    valores do campo i somente nas linhas em que i e j estão preenchidos e a soma dos
+    produtos dos desvios (co-momento).
+
+    Args:
+        matrix: Matriz numerica (linhas x colunas), retornada por numeric_matrix.
+
+    Returns:
+        Um dicionario com um array por coluna (ou matriz por par de colunas) para cada soma.
+    """
+    valid = ~np.isnan(matrix)
+    pair_valid = valid.astype(np.float64)
+    n = valid.sum(axis=0).astype(np.float64)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # Momentos centrais (com os nulos zerados para as somas)
+        mean = np.where(n > 0, np.nansum(matrix, axis=0) / n, 0.0)
+        centered = np.where(valid, matrix - mean, 0.0)
+
+        # Posição [i, j] = soma do campo i nas linhas em que i e j estão preenchidos
+        pair_n = pair_valid.T @ pair_valid
+        pair_sum = centered.T @ pair_valid
+        pair_mean = np.where(pair_n > 0, pair_sum / pair_n, 0.0)
+        pair_m2 = np.maximum((centered ** 2).T @ pair_valid - pair_sum * pair_mean, 0.0)
+        co_moment = centered.T @ centered - pair_sum * pair_mean.T
+
+    return {
+        "n": n,
+        "mean": mean,
+        "m2": (centered ** 2).sum(axis=0),
+        "m3": (centered ** 3).sum(axis=0),
+        "m4": (centered ** 4).sum(axis=0),
+        "pair_n": pair_n,
+        "pair_mean": pair_mean + mean[:, None],
+        "pair_m2": pair_m2,
+        "co_moment": co_moment,
+    }
+
+
+def select_moments(moments: Dict[str, np.ndarray], positions: list) -> Dict[str, np.ndarray]:
+    """
+    Retorna as somas parciais somente das colunas nas posições informadas (na ordem
+    informada).
+    """
+    selected = {}
+    for key, value in moments.items():
+        selected[key] = value[np.ix_(positions, positions)] if key.startswith(("pair_", "co_")) else value[positions]
+    return selected
+
+
+def merge_moments(a: Dict[str, np.ndarray], b: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Agrega as somas parciais de duas partes do arquivo (mesmas colunas, na mesma
+    ordem), com as formulas de atualização dos momentos centrais (Chan / Pébay).
+
+    Returns:
+        As somas parciais das duas partes juntas.
+    """
+    na, nb = a["n"], b["n"]
+    n = na + nb
+    n_div = np.maximum(n, 1.0)
+    delta = b["mean"] - a["mean"]
+
+    m2 = a["m2"] + b["m2"] + delta ** 2 * na * nb / n_div
+    m3 = (a["m3"] + b["m3"] + delta ** 3 * na * nb * (na - nb) / n_div ** 2
+          + 3.0 * delta * (na * b["m2"] - nb * a["m2"]) / n_div)
+    m4 = (a["m4"] + b["m4"] + delta ** 4 * na * nb * (na * na - na * nb + nb * nb) / n_div ** 3
+          + 6.0 * delta ** 2 * (na * na * b["m2"] + nb * nb * a["m2"]) / n_div ** 2
+          + 4.0 * delta * (na * b["m3"] - nb * a["m3"]) / n_div)
+
+    pair_n = a["pair_n"] + b["pair_n"]
+    pair_weight = a["pair_n"] * b["pair_n"] / np.maximum(pair_n, 1.0)
+    pair_delta = b["pair_mean"] - a["pair_mean"]
+
+    return {
+        "n": n,
+        "mean": a["mean"] + delta * nb / n_div,
+        "m2": m2,
+        "m3": m3,
+        "m4": m4,
+        "pair_n": pair_n,
+        "pair_mean": a["pair_mean"] + pair_delta * b["pair_n"] / np.maximum(pair_n, 1.0),
+        "pair_m2": a["pair_m2"] + b["pair_m2"] + pair_delta ** 2 * pair_weight,
+        "co_moment": a["co_moment"] + b["co_moment"] + pair_delta * pair_delta.T * pair_weight,
+    }
+
+
+def _first_occurrence(mask: np.ndarray, matrix: np.ndarray, index: pd.Index) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Retorna, por coluna, a quantidade de ocorrências e o indice e valor da primeira
+    found = mask.any(axis=0)
+    position = mask.argmax(axis=0)
+    first_index = np.array([index[p] if f else None for f, p in zip(found, position)], dtype=object)
+    first_value = np.where(found, matrix[position, np.arange(matrix.shape[1])], np.nan)
+    return mask.sum(axis=0), first_index, first_value
+
+
+def _order_stats(matrix: np.ndarray, index: pd.Index, mean: np.ndarray, std: np.ndarray) -> Dict[str, np.ndarray]:
+    # ----------------------------------------------------------------------------------
+    # Quantis, extremos e outliers (IQR e z-score) das colunas da matriz, que precisam
+    # de todos os valores da coluna. A media e o desvio padrão são os do perfil.
+    # ----------------------------------------------------------------------------------
+    k = matrix.shape[1]
+    valid = ~np.isnan(matrix)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # Quantis e limites de IQR
+        if k > 0 and len(matrix) > 0:
+            quantiles = np.nanquantile(matrix, QUANTILES, axis=0)
+            minimum = np.nanmin(matrix, axis=0)
+            maximum = np.nanmax(matrix, axis=0)
+        else:
+            quantiles = np.full((len(QUANTILES), k), np.nan)
+            minimum = maximum = np.full(k, np.nan)
+        q1 = quantiles[QUANTILES.index(0.25)]
+        q3 = quantiles[QUANTILES.index(0.75)]
+        iqr = q3 - q1
+        iqr_low = q1 - IQR_FACTOR * iqr
+        iqr_high = q3 + IQR_FACTOR * iqr
+        iqr_mask = valid & ((matrix < iqr_low) | (matrix > iqr_high))
+
+        # Z-score
+        zscore = np.abs(matrix - mean) / std
+        z_mask = valid & (zscore > ZSCORE_LIMIT)
+
+    iqr_count, iqr_first_index, iqr_first_value = _first_occurrence(iqr_mask, matrix, index)
+    z_count, z_first_index, z_first_value = _first_occurrence(z_mask, matrix, index)
+
+    return {
+        "quantiles": quantiles,
+        "minimum": minimum,
+        "maximum": maximum,
+        "iqr_low": iqr_low,
+        "iqr_high": iqr_high,
+        "iqr_count": iqr_count,
+        "iqr_first_index": iqr_first_index,
+        "iqr_first_value": iqr_first_value,
+        "z_count": z_count,
+        "z_first_index": z_first_index,
+        "z_first_value": z_first_value,
+    }
+
+
+def profile_numeric_columns(df_data: DataFrame) -> Dict[str, Any]:
+    """
+    Calcula, de uma só vez, o perfil estatistico de todas as colunas numericas do
+    DataFrame: momentos, quantis, limites de IQR, contagem de z-score e matrizes de
+    correlação e covariancia.
+
+    Args:
+        df_data: O DataFrame Pandas contendo os dados do arquivo.
+
+    Returns:
+        Um dicionario com os nomes das colunas e um array (uma posição por coluna)
+        para cada estatistica.
+    """
+    columns, matrix = numeric_matrix(df_data)
+    return finish_profile(columns, moments_partial(matrix), columns, matrix, df_data.index)
+
+
+def finish_profile(columns: list, moments: Dict[str, np.ndarray], order_columns: list,
+                   order_matrix: np.ndarray, order_index: pd.Index) -> Dict[str, Any]:
+    """
+    Calcula o perfil a partir das somas parciais (agregadas) das colunas e, somente
+    para as colunas em order_columns, das estatisticas de ordem (quantis e outliers).
+
+    Args:
+        columns: Nomes das colunas das somas parciais.
+        moments: Somas parciais (moments_partial / merge_moments).
+        order_columns: Colunas com quantis e outliers calculados.
+        order_matrix: Valores das colunas de order_columns (linhas x order_columns).
+        order_index: Indice das linhas de order_matrix (usado nos exemplos de erro).
+
+    Returns:
+        O perfil, no mesmo formato de profile_numeric_columns.
+    """
+    # As colunas sem nenhum valor preenchido ficam fora do perfil (empty_columns)
+    com_valores = [pos for pos, total in enumerate(moments["n"]) if total > 0]
+    empty_columns = [col for pos, col in enumerate(columns) if moments["n"][pos] == 0]
+    if empty_columns:
+        columns = [columns[pos] for pos in com_valores]
+        moments = select_moments(moments, com_valores)
+        keep = [i for i, col in enumerate(order_columns) if col in columns]
+        order_columns = [order_columns[i] for i in keep]
+        order_matrix = order_matrix[:, keep]
+
+    k = len(columns)
+    n = moments["n"]
+    pair_n = moments["pair_n"]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(n > 0, moments["mean"], np.nan)
+        m2 = moments["m2"] / n
+        m3 = moments["m3"] / n
+        m4 = moments["m4"] / n
+        std = np.sqrt(moments["m2"] / (n - 1))
+
+        # Assimetria e curtose com o mesmo ajuste amostral do pandas (skew/kurt)
+        g1 = m3 / m2 ** 1.5
+        g2 = m4 / m2 ** 2 - 3.0
+        skew = np.where(n > 2, np.sqrt(n * (n - 1)) / (n - 2) * g1, np.nan)
+        kurt = np.where(n > 3, (n - 1) / ((n - 2) * (n - 3)) * ((n + 1) * g2 + 6.0), np.nan)
+        # Coluna constante: 0 (como no pandas), somente quando há valores suficientes
+        skew = np.where((m2 == 0) & (n > 2), 0.0, skew)
+        kurt = np.where((m2 == 0) & (n > 3), 0.0, kurt)
+
+        # Covariancia e correlação de cada par de colunas somente com as linhas
+        # preenchidas nos dois campos (mesma regra do pandas)
+        cov = np.where(pair_n > 1, moments["co_moment"] / (pair_n - 1), np.nan)
+        corr = moments["co_moment"] / np.sqrt(moments["pair_m2"] * moments["pair_m2"].T)
+
+    profile = {
+        "columns": columns,
+        "empty_columns": empty_columns,
+        "count": n,
+        "mean": mean,
+        "std": std,
+        "skew": skew,
+        "kurt": kurt,
+        "cov": cov,
+        "corr": corr,
+        "has_order": np.zeros(k, dtype=bool),
+        "quantiles": np.full((len(QUANTILES), k), np.nan),
+        "iqr_first_index": np.full(k, None, dtype=object),
+        "z_first_index": np.full(k, None, dtype=object),
+    }
+    for key in ("minimum", "maximum", "iqr_low", "iqr_high", "iqr_first_value", "z_first_value"):
+        profile[key] = np.full(k, np.nan)
+    for key in ("iqr_count", "z_count"):
+        profile[key] = np.zeros(k, dtype=np.int64)
+
+    if order_columns:
+        positions = [columns.index(col) for col in order_columns]
+        stats = _order_stats(order_matrix, order_index, mean[positions], std[positions])
+        for key, value in stats.items():
+            if value.ndim == 2:
+                profile[key][:, positions] = value
+            else:
+                profile[key][positions] = value
+        profile["has_order"][positions] = True
+
+    return profile
+
+
+def clear_profile_cache():
+    """
+    Descarta o perfil em cache. Deve ser chamada ao fim da validação de cada arquivo.
+    """
+    _PROFILE_CACHE.update({"df": None, "key": None, "profile": None})
+
+
+def _get_profile(df_data: DataFrame) -> Dict[str, Any]:
+    # Reaproveita o perfil se o DataFrame (e seu formato) for o mesmo da chamada anterior
+    key = (df_data.shape, tuple(df_data.columns))
+    ref = _PROFILE_CACHE["df"]
+    if ref is not None and ref() is df_data and _PROFILE_CACHE["key"] == key:
+        return _PROFILE_CACHE["profile"]
+    profile = profile_numeric_columns(df_data)
+    _PROFILE_CACHE.update({"df": weakref.ref(df_data), "key": key, "profile": profile})
+    return profile
+
+
+def _locate_in_profile(profile: Dict[str, Any], data_columns: list, row: Series) -> Tuple[Optional[int], Optional[Tuple[str, str, str]]]:
+    # Retorna a posição da coluna no perfil ou a tupla de retorno em caso de erro
+    field_name_raw = str(row["field"])
+    field_name_sanitized = field_name_raw.strip().lower()
+    colunas_sanitized = [str(col).strip().lower() for col in profile["columns"]]
+
+    if field_name_sanitized in colunas_sanitized:
+        return colunas_sanitized.index(field_name_sanitized), None
+
+    if field_name_sanitized in [str(col).strip().lower() for col in profile["empty_columns"]]:
+        return None, ("Não foi possivel validar", "error",
+                      f"ERRO: Coluna '{field_name_raw}' sem valores preenchidos. Não é possivel calcular o perfil estatistico.")
+
+    if field_name_sanitized not in [str(col).strip().lower() for col in data_columns]:
+        return None, ("Campo não encontrado para checagem.", "fail",
+                      f"A coluna '{field_name_raw}' não existe no DataFrame de dados.")
+
+    return None, ("Não foi possivel validar", "error",
+                  f"ERRO: Coluna '{field_name_raw}' possui valores não numericos. Não é possivel calcular o perfil estatistico.")
+
+
+def _outlier_result(profile: Dict[str, Any], j: int, prefix: str, label: str) -> Tuple[str, str, Optional[str]]:
+    # Monta o retorno padrão das checagens de outliers (IQR e z-score)
+    total_linhas = profile["count"][j]
+    outliers = int(profile[f"{prefix}_count"][j])
+    percentual = (outliers / total_linhas) * 100 if total_linhas > 0 else 0.00
+
+    evidence_msg = f"{label}: {percentual:.2f}%"
+
+    if outliers == 0:
+        return evidence_msg, "pass", ""
+
+    primeiro_valor = profile[f"{prefix}_first_value"][j]
+    primeiro_indice = profile[f"{prefix}_first_index"][j] + 2  # Corrige o numero do indice
+
+    details = (
+        f"Total de {outliers} outlier(s). "
+        f"Linha com exemplo de erro: ({primeiro_indice}): "
+        f"Valor encontrado: {primeiro_valor:g}"
+    )
+    return evidence_msg, "fail", details
+
+
+def _strongest_pair(profile: Dict[str, Any], j: int, key: str) -> Tuple[Optional[str], float]:
+    # Retorna a outra coluna com maior valor absoluto na matriz informada
+    valores = np.abs(profile[key][j]).copy()
+    valores[j] = np.nan
+    if np.isnan(valores).all():
+        return None, np.nan
+    pos = int(np.nanargmax(valores))
+    return profile["columns"][pos], float(profile[key][j, pos])
+
+
+def _routine_error(routine: str, e: Exception) -> Tuple[str, str, Optional[str]]:
+    evidence_msg = "Erro na rotina de analise."
+    details = f"FALHA INESPERADA na rotina {routine}: {type(e).__name__}: {str(e)}"
+    return evidence_msg, "error", details
+
+
+def _iqr_outliers_result(profile: Dict[str, Any], j: int) -> Tuple[str, str, Optional[str]]:
+    evidence_msg, status, details = _outlier_result(profile, j, "iqr", "Outliers IQR")
+    limites = f"Limites: [{profile['iqr_low'][j]:g}, {profile['iqr_high'][j]:g}]"
+    details = f"{limites}. {details}" if details else limites
+    return evidence_msg, status, details
+
+
+def _zscore_outliers_result(profile: Dict[str, Any], j: int) -> Tuple[str, str, Optional[str]]:
+    return _outlier_result(profile, j, "z", "Outliers z-score")
+
+
+def _skewness_result(profile: Dict[str, Any], j: int) -> Tuple[str, str, Optional[str]]:
+    skew = profile["skew"][j]
+    if skew > 1:
+        details = "Distribuição assimétrica à direita."
+    elif skew < -1:
+        details = "Distribuição assimétrica à esquerda."
+    else:
+        details = "Distribuição aproximadamente simétrica."
+    return f"Assimetria: {skew:.4f}", "info", details
+
+
+def _kurtosis_result(profile: Dict[str, Any], j: int) -> Tuple[str, str, Optional[str]]:
+    kurt = profile["kurt"][j]
+    details = (
+        f"Média: {profile['mean'][j]:g}, Desvio padrão: {profile['std'][j]:g}, "
+        f"Valores: {int(profile['count'][j])}"
+    )
+    return f"Curtose: {kurt:.4f}", "info", details
+
+
+def _quantiles_result(profile: Dict[str, Any], j: int) -> Tuple[str, str, Optional[str]]:
+    quantis = profile["quantiles"][:, j]
+    evidence_msg = f"P01: {quantis[0]:g} P99: {quantis[-1]:g}"
+    details = ", ".join(f"P{int(q * 100):02d}: {v:g}" for q, v in zip(QUANTILES, quantis))
+    details += f" [Min: {profile['minimum'][j]:g}, Max: {profile['maximum'][j]:g}]"
+    return evidence_msg, "info", details
+
+
+def _correlation_result(profile: Dict[str, Any], j: int) -> Tuple[str, str, Optional[str]]:
+    coluna, valor = _strongest_pair(profile, j, "corr")
+    if coluna is None:
+        return "Sem colunas para comparação", "info", ""
+    return f"Maior correlação: {valor:.4f}", "info", f"Coluna: '{coluna}'"
+
+
+def _covariance_result(profile: Dict[str, Any], j: int) -> Tuple[str, str, Optional[str]]:
+    evidence_msg = f"Variancia: {profile['cov'][j, j]:g}"
+    coluna, valor = _strongest_pair(profile, j, "cov")
+    if coluna is None:
+        return evidence_msg, "info", ""
+    return evidence_msg, "info", f"Maior covariancia: {valor:g} (coluna '{coluna}')"
+
+
+def run_profile_check(routine: str, profile: Dict[str, Any], data_columns: list, row: Series) -> Tuple[str, str, Optional[str]]:
+    """
+    Executa uma checagem de perfil sobre um perfil já calculado.
+
+    Args:
+        routine: Nome da rotina (chave de PROFILE_CHECKS).
+        profile: Perfil retornado por profile_numeric_columns.
+        data_columns: Colunas do DataFrame de dados.
+        row: Registro do campo, com o nome em row['field'].
+
+    Returns:
+        Uma tupla contendo: (evidence_msg, status, details)
+    """
+    try:
+        j, retorno = _locate_in_profile(profile, data_columns, row)
+        if j is None:
+            return retorno
+        if routine in ORDER_STAT_CHECKS and not profile["has_order"][j]:
+            return ("Não foi possivel validar", "error",
+                    f"ERRO: Quantis da coluna '{row['field']}' não calculados no perfil estatistico.")
+        return PROFILE_CHECKS[routine](profile, j)
+    except Exception as e:
+        return _routine_error(routine, e)
+
+
+def _run_check(routine: str, df_data: DataFrame, row: Series) -> Tuple[str, str, Optional[str]]:
+    # Calcula (ou reaproveita) o perfil do DataFrame e executa a checagem
+    try:
+        profile = _get_profile(df_data)
+    except Exception as e:
+        return _routine_error(routine, e)
+    return run_profile_check(routine, profile, df_data.columns, row)
+
+
+# Rotinas de validação
+
+def check_iqr_outliers(df_data: DataFrame, df_fields: DataFrame, row: Series) -> Tuple[str, str, Optional[str]]:
+    """
+    Conta os valores fora dos limites de IQR (Q1 - 1.5*IQR, Q3 + 1.5*IQR) do campo.
+
+    Returns:
+        Uma tupla contendo: (evidence_msg, status, details)
+    """
+    return _run_check("check_iqr_outliers", df_data, row)
+
+
+def check_zscore_outliers(df_data: DataFrame, df_fields: DataFrame, row: Series) -> Tuple[str, str, Optional[str]]:
+    """
+    Conta os valores do campo com z-score fora de ±3 desvios padrão.
+
+    Returns:
+        Uma tupla contendo: (evidence_msg, status, details)
+    """
+    return _run_check("check_zscore_outliers", df_data, row)
+
+
+def check_skewness(df_data: DataFrame, df_fields: DataFrame, row: Series) -> Tuple[str, str, Optional[str]]:
+    """
+    Informa a assimetria (skewness) da distribuição do campo.
+
+    Returns:
+        Uma tupla contendo: (evidence_msg, status, details)
+    """
+    return _run_check("check_skewness", df_data, row)
+
+
+def check_kurtosis(df_data: DataFrame, df_fields: DataFrame, row: Series) -> Tuple[str, str, Optional[str]]:
+    """
+    Informa a curtose (excesso, como no pandas) da distribuição do campo.
+
+    Returns:
+        Uma tupla contendo: (evidence_msg, status, details)
+    """
+    return _run_check("check_kurtosis", df_data, row)
+
+
+def check_quantiles(df_data: DataFrame, df_fields: DataFrame, row: Series) -> Tuple[str, str, Optional[str]]:
+    """
+    Informa os quantis do campo (1%, 25%, 50%, 75% e 99%) e os valores extremos.
+
+    Returns:
+        Uma tupla contendo: (evidence_msg, status, details)
+    """
+    return _run_check("check_quantiles", df_data, row)
+
+
+def check_correlation(df_data: DataFrame, df_fields: DataFrame, row: Series) -> Tuple[str, str, Optional[str]]:
+    """
+    Informa a coluna numerica do arquivo com maior correlação (Pearson) com o campo.
+
+    Returns:
+        Uma tupla contendo: (evidence_msg, status, details)
+    """
+    return _run_check("check_correlation", df_data, row)
+
+
+def check_covariance(df_data: DataFrame, df_fields: DataFrame, row: Series) -> Tuple[str, str, Optional[str]]:
+    """
+    Informa a variancia do campo e a coluna numerica com maior covariancia absoluta.
+
+    Returns:
+        Uma tupla contendo: (evidence_msg, status, details)
+    """
+    return _run_check("check_covariance", df_data, row)
+
+
+# Rotinas de perfil que precisam de todos os valores da coluna (quantis e outliers)
+ORDER_STAT_CHECKS = ("check_iqr_outliers", "check_zscore_outliers", "check_quantiles")
+
+# Rotinas de perfil (calculadas sobre o perfil completo do arquivo)
+PROFILE_CHECKS = {
+    "check_iqr_outliers": _iqr_outliers_result,
+    "check_zscore_outliers": _zscore_outliers_result,
+    "check_skewness": _skewness_result,
+    "check_kurtosis": _kurtosis_result,
+    "check_quantiles": _quantiles_result,
+    "check_correlation": _correlation_result,
+    "check_covariance": _covariance_result,
+}
@@ -1,10 +1,13 @@
+import os
 import pandas as pd
 from pandas import DataFrame, Series
-from typing import Dict, Any, Tuple, Optional, Union
+from typing import Dict, Any, List, Tuple, Optional, Union
 import traceback
 import sys 
 import re
 
+from src.utilities.utilities import format_file_size
+
 # Rotinas auxiliares
 
 def field_apply_list(df_data: DataFrame, df_fields: DataFrame, row: Series) -> Tuple[str, str, Optional[str]]:
@@ -57,26 +60,97 @@ def field_apply_list(df_data: DataFrame, df_fields: DataFrame, row: Series) -> T
 
     return apply_list
 
-# Rotinas de validação
 
-def check_null_empty(df_data: DataFrame, df_fields: DataFrame, row: Series) -> Tuple[str, str, Optional[str]]:
-    """
+def build_checks(df_fields: DataFrame, df_validations: DataFrame, columns: Optional[List[str]] = None) -> List[Tuple[Series, Series]]:
     # ----------------------------------------------------------------------------------
-    #  Checagem de Nulos e vazios em um campo
+    # Monta a lista (campo, checagem) com as checagens ativas de cada campo, com a mesma
+    # seleção do notebook (caracteristicas do campo x coluna 'apply' das validações)
+    # Com columns informado, ignora os campos que não estão entre as colunas do arquivo
     # ----------------------------------------------------------------------------------
-
-    Realiza uma checagem de valores nulos (NaN) e vazios (strings com espaços ou vazias)
-    estritamente no campo especificado por row['field'].
-
-    Args:
-        df_data: O DataFrame Pandas contendo os dados.
-        df_fields: (Não utilizado nesta rotina, mas mantido na assinatura).
-        row: A Series (linha de metadados) que contém o nome do campo a ser checado via row['field'].
-
-    Returns:
-        Uma tupla contendo: (evidence_msg, status, details)
-    """
-    
+    checks = []
+    mask_active = (df_validations['active'] == 'yes')
+    for _, row in df_fields.iterrows():
+        # ignora colunas que não foram encontradas
+        if columns is not None and str(row["field"]).strip().lower() not in columns:
+            continue
+        apply_list = field_apply_list(None, df_fields, row)
+        apply_set = set([item.strip().lower() for item in apply_list])
+        mask_apply = df_validations['apply'].apply(lambda x: len(set(str(x).lower().replace(' ', '').split(',')) & apply_set) > 0)
+        for _, check_row in df_validations[mask_apply & mask_active].iterrows():
+            checks.append((row, check_row))
+    return checks
+
+def save_result(file: str, field: str, category: str, test: str, evidence: Any, detail: Optional[str] = None, status: str = "PASS") -> Dict[str, Any]:
+    # Registro do resultado das analises (mesmo formato do relatório do notebook)
+    return {"file": file, "Field": field, "category": category, "test": test, "evidence": evidence, "detail": detail, "status": status}
+
+
+def check_structure(file_path: str, line_count: int, columns: List[str], df_fields: DataFrame) -> List[Dict[str, Any]]:
+    # ----------------------------------------------------------------------------------
+    # Informações de estrutura do arquivo (mesmas do notebook): tamanho e quantidade de
+    # linhas/colunas, colunas configuradas faltantes e nomes de colunas duplicados
+    # columns: nomes das colunas do arquivo já sanitizados (minusculo, sem espaços)
+    # ----------------------------------------------------------------------------------
+    file_name = os.path.basename(file_path)
+    results = []
+
+    # Coleta estatisticas no nivel do arquivo
+    file_size = format_file_size(os.path.getsize(file_path))
+    evidence_str = "Tamanho: " + file_size + " Linhas/Colunas: " + str(line_count) + "/" + str(len(columns))
+    results.append(save_result(file_name, "Todos", "structure", "file info", evidence_str, "", "pass"))
+
+    # Testa colunas faltantes
+    df_file_fields = df_fields[df_fields["file"].str.strip().str.lower() == file_name.strip().lower()]
+    expected_set = set(df_file_fields["field"].str.strip().str.lower())
+    missing_columns = expected_set.difference(set(columns))
+    str_missing_columns = ", ".join(sorted(missing_columns)) if missing_columns else "nenhuma"
+
+    # Testa colunas com nome duplicados
+    nomes_sem_sufixo = pd.Series(list(columns), dtype="object").str.replace(r'\.\d+$', '', regex=True)
+    contagem_nomes = nomes_sem_sufixo.value_counts()
+    lista_nomes_duplicados = contagem_nomes[contagem_nomes > 1].index.tolist()
+    resultado_string = ", ".join(lista_nomes_duplicados) if lista_nomes_duplicados else "nenhum"
+
+    status = "pass" if resultado_string == "nenhum" and str_missing_columns == "nenhuma" else "fail"
+    evidence_str = "Faltantes: " + str_missing_columns + " Nomes_duplicados: " + resultado_string
+    results.append(save_result(file_name, "Todos", "structure", "Column info", evidence_str, "", status))
+
+    return results
+
+# Contagens parciais das validações
+#
+# Cada checagem é dividida em duas etapas: a contagem parcial (_xxx_partial), que
+# percorre os dados e devolve um dicionario com os totais e a primeira ocorrencia de
+# erro, e a formatação (_xxx_format), que gera a tupla (evidence_msg, status, details).
+# As contagens parciais de partes diferentes do mesmo arquivo podem ser somadas
+# (ver src.analisys.parallel), o que permite validar um arquivo em paralelo com as
+# mesmas regras. Quando a contagem já resulta em retorno definitivo (campo não
+# encontrado, parametro invalido), ela devolve a propria tupla de retorno.
+
+def _numeric_values(df_data: DataFrame, field_name: str) -> Series:
+    # separar valores numericos e não numericos da coluna 
+    coluna_numerica = pd.to_numeric(
+    df_data[field_name].astype(str).str.replace(',', '.', regex=False), errors='coerce')  # padroniza virgula para separador decimal
+    # Cria a Máscara Booleana de Ruído:
+    # True onde o valor NÃO É NaN (foi convertido com sucesso)
+    mascara_numerico = coluna_numerica.notna()
+    # 3. Cria a Série de Valores que Podem Ser Convertidos (Os Limpos)
+    # Usa o isna() no DataFrame original onde a máscara é True
+    df_valores_numericos = df_data.loc[mascara_numerico, field_name]
+    df_valores_numericos = pd.to_numeric(df_valores_numericos, errors='raise')
+    return df_valores_numericos
+
+def _first_error(mascara_erro: Series, valores: Series) -> Dict[str, Any]:
+    # Contagem de erros e primeira ocorrencia (indice do DataFrame e valor)
+    erros_encontrados = int(mascara_erro.sum())
+    if erros_encontrados == 0:
+        return {"total": len(mascara_erro), "errors": 0, "first_index": None, "first_value": None}
+    # O idxmax() retorna o índice da primeira ocorrência do valor máximo (True=1, False=0)
+    primeiro_erro_indice = mascara_erro.idxmax()
+    return {"total": len(mascara_erro), "errors": erros_encontrados,
+            "first_index": primeiro_erro_indice, "first_value": valores.loc[primeiro_erro_indice]}
+
+def _null_empty_partial(df_data: DataFrame, df_fields: DataFrame, row: Series) -> Union[Dict[str, Any], Tuple[str, str, Optional[str]]]:
     # 1. Extrair e Sanitizar o Nome do Campo
     #    Sanitiza-se o nome esperado (row['field']) para comparação
     field_name_raw = row['field']
@@ -106,9 +180,15 @@ def check_null_empty(df_data: DataFrame, df_fields: DataFrame, row: Series) -> T
         # Verifica se o valor é string vazia ou contém apenas espaços (após conversão para str)
         empty_count = df_data[nome_coluna_real].astype(str).str.strip().eq('').sum()
 
+    return {"total": len(df_data), "nulls": int(null_count), "empty": int(empty_count)}
+
+def _null_empty_format(partial: Dict[str, Any], row: Series) -> Tuple[str, str, Optional[str]]:
+    null_count = partial["nulls"]
+    empty_count = partial["empty"]
+
     # 6. Cálculo de Estatísticas Focadas
     total_missing = null_count + empty_count
-    total_rows = len(df_data)
+    total_rows = partial["total"]
     
     # 7. Determinar Status e Gerar Mensagens
     
@@ -133,20 +213,7 @@ def check_null_empty(df_data: DataFrame, df_fields: DataFrame, row: Series) -> T
     
     return evidence_msg, status, details
 
-def check_regex_format(df_data: DataFrame, df_fields: DataFrame, row: Series) -> Tuple[str, str, Optional[str]]:
-    """
-    Aplica uma expressão regular (REGEX) a um campo específico do DataFrame de dados,
-    retornando o percentual de compatibilidade e o detalhe do primeiro erro.
-
-    Args:
-        df_data: DataFrame com os dados a serem analisados.
-        df_fields: DataFrame de campos (mantido na assinatura, mas não utilizado).
-        row: Registro de testes com 'format' (REGEX) e 'field' (nome do campo).
-
-    Returns:
-        Uma tupla contendo: (evidence_msg, status, details)
-    """
-    
+def _regex_format_partial(df_data: DataFrame, df_fields: DataFrame, row: Series) -> Dict[str, Any]:
     # 1. Extrair e Sanitizar os Parâmetros
     field_name = str(row["field"]).strip()
     regex_pattern = str(row["format_regex"]).strip()
@@ -170,9 +237,12 @@ def check_regex_format(df_data: DataFrame, df_fields: DataFrame, row: Series) ->
     # Remove os nulos (que viraram 'nan') da contagem de erros, se necessário.
     # Se você quer incluir 'nan' como erro, remova esta linha:
     # máscara_erro = mascara_erro & series_alvo.str.lower().ne('nan')
-    
-    total_linhas = len(df_data)
-    erros_encontrados = mascara_erro.sum()
+
+    return _first_error(mascara_erro, df_data[field_name])
+
+def _regex_format_format(partial: Dict[str, Any], row: Series) -> Tuple[str, str, Optional[str]]:
+    total_linhas = partial["total"]
+    erros_encontrados = partial["errors"]
     
     # 4. Cálculo de Métricas
     compatibilidade_percentual = ((total_linhas - erros_encontrados) / total_linhas) * 100
@@ -190,13 +260,9 @@ def check_regex_format(df_data: DataFrame, df_fields: DataFrame, row: Series) ->
         # 5b. Falha: Encontrar o Primeiro Erro
         status = "fail"
         
-        # Encontra o índice (número da linha) da primeira ocorrência True (erro)
-        # O idxmax() retorna o índice da primeira ocorrência do valor máximo (True=1, False=0)
-        primeiro_erro_indice = mascara_erro.idxmax()
-        primeiro_erro_valor = df_data.loc[primeiro_erro_indice, field_name]        
-        primeiro_erro_indice += 2 # compensa erro na atribuição do indice. 
         # Obtém o valor real que causou o erro
- 
+        primeiro_erro_valor = partial["first_value"]
+        primeiro_erro_indice = partial["first_index"] + 2 # compensa erro na atribuição do indice. 
         
         # Geração de Detalhes
         details = (
@@ -206,64 +272,209 @@ def check_regex_format(df_data: DataFrame, df_fields: DataFrame, row: Series) ->
         
     return evidence_msg, status, details
 
-def check_zero_values(df_data: DataFrame, df_fields: DataFrame, row: Series) -> Tuple[str, str, Optional[str]]:
+def _zero_values_partial(df_data: DataFrame, df_fields: DataFrame, row: Series) -> Union[Dict[str, Any], Tuple[str, str, Optional[str]]]:
+    # 1. Extrair e Sanitizar os Parâmetros
+    field_name = str(row["field"]).strip()
+    df_valores_numericos = _numeric_values(df_data, field_name)
 
-    try: 
-        # 1. Extrair e Sanitizar os Parâmetros
-        field_name = str(row["field"]).strip()
-
-        # separar valores numericos e não numericos da coluna 
-        coluna_numerica = pd.to_numeric(
-        df_data[field_name].astype(str).str.replace(',', '.', regex=False), errors='coerce')  # padroniza virgula para separador decimal
-        # Cria a Máscara Booleana de Ruído:
-        # True onde o valor NÃO É NaN (foi convertido com sucesso)
-        mascara_numerico = coluna_numerica.notna()
-        # 3. Cria a Série de Valores que Podem Ser Convertidos (Os Limpos)
-        # Usa o isna() no DataFrame original onde a máscara é True
-        df_valores_numericos = df_data.loc[mascara_numerico, field_name]
-        df_valores_numericos = pd.to_numeric(df_valores_numericos, errors='raise')
-
-        #pd.to_numeric(df_valores_numericos, errors='coerce')
-        # 4. Cria a Série de Valores de Ruído (Os Não Convertíveis)
-        #    Usa o inverso da máscara (~mascara_numerico)
-        df_valores_nao_numericos = df_data.loc[~mascara_numerico, field_name]   
-
-        # 3. Aplicação da Máscara (Valores Iguais a Zero)
-        series_alvo = df_valores_numericos  
-        if series_alvo.dtype in ['object', 'string']:
+    # 3. Aplicação da Máscara (Valores Iguais a Zero)
+    series_alvo = df_valores_numericos  
+    if series_alvo.dtype in ['object', 'string']:
+        evidence_msg = "Não foi possivel validar"
+        status = "error"
+        details = f"ERRO: Coluna '{field_name}' é do tipo {series_alvo.dtype}. Não é ideal para checagem de zero numérico."
+        return evidence_msg, status, details  # Retorno 2 (Em caso de tipo de dado inadequado)
+
+    return _first_error(series_alvo == 0, df_valores_numericos)
+
+def _zero_values_format(partial: Dict[str, Any], row: Series) -> Tuple[str, str, Optional[str]]:
+    # 4. Cálculo de Métricas
+    total_linhas = partial["total"]
+    negativos_encontrados = partial["errors"]
+    percentual_negativos = (negativos_encontrados / total_linhas) * 100 if total_linhas > 0 else 0.00
+
+    # 5. Geração de Retorno Padrão
+    evidence_msg = f"Zerados: {percentual_negativos:.2f}%"
+
+    if percentual_negativos == 0.00:
+        status = "pass"
+        details = "" # Retorno 3 (Sucesso)
+    else:
+        # 6. Falha: Encontrar o Primeiro Erro
+        status = "fail"
+        primeiro_negativo_valor = partial["first_value"]
+        primeiro_negativo_indice = partial["first_index"] + 2 # Corrige o numero do indice
+
+        details = (
+            f"Linha com exemplo de erro: ({primeiro_negativo_indice}): "
+            f"Valor encontrado: {primeiro_negativo_valor}"
+        )
+
+    return evidence_msg, status, details
+
+def _negative_values_partial(df_data: DataFrame, df_fields: DataFrame, row: Series) -> Union[Dict[str, Any], Tuple[str, str, Optional[str]]]:
+    # 1. Extrair e Sanitizar os Parâmetros
+    field_name = str(row["field"]).strip()
+    df_valores_numericos = _numeric_values(df_data, field_name)
+
+    # 3. Aplicação da Máscara (Valores Negativos)
+    series_alvo = df_valores_numericos
+    
+    if series_alvo.dtype in ['object', 'string']:
+        evidence_msg = "Não foi possivel validar"
+        status = "error"
+        details = f"ERRO: Coluna '{field_name}' é do tipo {series_alvo.dtype}. Não é ideal para checagem de valores negativos."
+        return evidence_msg, status, details  # Retorno 2 (Em caso de tipo de dado inadequado)
+
+    return _first_error(series_alvo < 0, df_valores_numericos)
+
+def _negative_values_format(partial: Dict[str, Any], row: Series) -> Tuple[str, str, Optional[str]]:
+    # 4. Cálculo de Métricas
+    total_linhas = partial["total"]
+    negativos_encontrados = partial["errors"]
+    percentual_negativos = (negativos_encontrados / total_linhas) * 100 if total_linhas > 0 else 0.00
+
+    # 5. Geração de Retorno Padrão
+    evidence_msg = f"Negativos: {percentual_negativos:.2f}%"
+
+    if percentual_negativos == 0.00:
+        status = "pass"
+        details = "" # Retorno 3 (Sucesso)
+    else:
+        # 6. Falha: Encontrar o Primeiro Erro
+        status = "fail"
+        primeiro_negativo_valor = partial["first_value"]
+        primeiro_negativo_indice = partial["first_index"] + 2 # Corrige o numero do indice
+
+        details = (
+            f"Linha com exemplo de erro: ({primeiro_negativo_indice}): "
+            f"Valor encontrado: {primeiro_negativo_valor}"
+        )
+
+    return evidence_msg, status, details
+
+def _valid_range_partial(df_data: DataFrame, df_fields: DataFrame, row: Series) -> Union[Dict[str, Any], Tuple[str, str, Optional[str]]]:
+    # 1. Extrair e Sanitizar os Parâmetros
+    field_name = str(row["field"]).strip()
+    field_range = str(row["range"]).strip()
+
+    df_valores_numericos = _numeric_values(df_data, field_name)
+
+    # Valida o formato do range 
+    # Formato esperado para o range "de x a y", onde x e y são qualquer numero
+    regex_formato = r"^de\s*([\d\.,]+)\s*a\s*([\d\.,]+)$"
+
+    if not re.fullmatch(regex_formato, field_range):
+        evidence_msg = "Não foi possivel validar"
+        details = f"ERRO: O campo '{field_name}' está com erro no formato range. deve ser 'de x a y', onde x w y são numeros."
+        status = "Error"
+        return evidence_msg, status, details
+    
+    # Extrai os ranges 
+    field_range_inicio = None 
+    field_range_fim = None
+
+    regex_intervalo = r"^de\s*([\d\.,]+)\s*a\s*([\d\.,]+)$"
+    match = re.fullmatch(regex_intervalo, field_range, re.IGNORECASE)
+
+    if match:
+        num1_str = match.group(1)
+        num2_str = match.group(2)
+
+        try:
+            field_range_inicio = float(num1_str.replace('.', '').replace(',', '.'))
+            field_range_fim = float(num2_str.replace('.', '').replace(',', '.'))
+        except ValueError:
             evidence_msg = "Não foi possivel validar"
-            status = "error"
-            details = f"ERRO: Coluna '{field_name}' é do tipo {series_alvo.dtype}. Não é ideal para checagem de zero numérico."
-            return evidence_msg, status, details  # Retorno 2 (Em caso de tipo de dado inadequado)
-
-        # 4. Cálculo de Métricas
-        mascara_negativos = (series_alvo == 0)
-        total_linhas = len(df_valores_numericos)
-        negativos_encontrados = mascara_negativos.sum()
-        percentual_negativos = (negativos_encontrados / total_linhas) * 100 if total_linhas > 0 else 0.00
-
-        # 5. Geração de Retorno Padrão
-        evidence_msg = f"Zerados: {percentual_negativos:.2f}%"
-   
-        if percentual_negativos == 0.00:
-            status = "pass"
-            details = "" # Retorno 3 (Sucesso)
-        else:
-            # 6. Falha: Encontrar o Primeiro Erro
-            status = "fail"
-            # Buscando o índice do erro (Pode ser o ponto de falha mais comum)
-            primeiro_negativo_indice = mascara_negativos.idxmax()
-            primeiro_negativo_valor =  df_valores_numericos.loc[primeiro_negativo_indice]
-            primeiro_negativo_indice += 2 # Corrige o numero do indice
-
-            details = (
-                f"Linha com exemplo de erro: ({primeiro_negativo_indice}): "
-                f"Valor encontrado: {primeiro_negativo_valor}"
-            )
+            details = f"ERRO: Não foi possivel extrair os ranges informados no campo '{field_name}'"
+            status = "Error"
+            return evidence_msg, status, details
 
+    # 3. Aplicação da Máscara (Valores Fora do Range)
+    series_alvo = df_valores_numericos
+    
+    if series_alvo.dtype in ['object', 'string']:
+        evidence_msg = "Não foi possivel validar"
+        status = "fail"
+        details = f"ERRO: Coluna '{field_name}' é do tipo {series_alvo.dtype}. Não é ideal para checagem de valores negativos."
+        return evidence_msg, status, details  # Retorno 2 (Em caso de tipo de dado inadequado)
+
+    mascara_range = (series_alvo >= field_range_inicio) & (series_alvo <= field_range_fim)
+    return _first_error(~mascara_range, df_valores_numericos)
+
+def _valid_range_format(partial: Dict[str, Any], row: Series) -> Tuple[str, str, Optional[str]]:
+    # 4. Cálculo de Métricas
+    total_linhas = partial["total"]
+    ranges_invalidos_encontrados = partial["errors"]
+    percentual_ranges_invalidos = (ranges_invalidos_encontrados / total_linhas) * 100 if total_linhas > 0 else 0.00
+
+    # 5. Geração de Retorno Padrão
+    evidence_msg = f"fora do range: {percentual_ranges_invalidos:.2f}%"
+
+    if percentual_ranges_invalidos == 0.00:
+        status = "pass"
+        details = "" # Retorno 3 (Sucesso)
+    else:
+        # 6. Falha: Encontrar o Primeiro Erro
+        status = "fail"
+        primeiro_range_invalido_indice = partial["first_index"]
+        primeiro_range_invalido_valor = partial["first_value"]
+
+        details = (
+            f"Linha com exemplo de erro: ({primeiro_range_invalido_indice}): "
+            f"Valor encontrado: {primeiro_range_invalido_valor}"
+        )
+
+    return evidence_msg, status, details
+
+def _apply_partial(partial_fn, format_fn, df_data: DataFrame, df_fields: DataFrame, row: Series) -> Tuple[str, str, Optional[str]]:
+    # Executa a contagem parcial sobre o DataFrame inteiro e formata o retorno
+    partial = partial_fn(df_data, df_fields, row)
+    if isinstance(partial, tuple):
+        return partial
+    return format_fn(partial, row)
+
+# Rotinas de validação
+
+def check_null_empty(df_data: DataFrame, df_fields: DataFrame, row: Series) -> Tuple[str, str, Optional[str]]:
+    """
+    # ----------------------------------------------------------------------------------
+    #  Checagem de Nulos e vazios em um campo
+    # ----------------------------------------------------------------------------------
+
+    Realiza uma checagem de valores nulos (NaN) e vazios (strings com espaços ou vazias)
+    estritamente no campo especificado por row['field'].
+
+    Args:
+        df_data: O DataFrame Pandas contendo os dados.
+        df_fields: (Não utilizado nesta rotina, mas mantido na assinatura).
+        row: A Series (linha de metadados) que contém o nome do campo a ser checado via row['field'].
+
+    Returns:
+        Uma tupla contendo: (evidence_msg, status, details)
+    """
+    return _apply_partial(_null_empty_partial, _null_empty_format, df_data, df_fields, row)
+
+def check_regex_format(df_data: DataFrame, df_fields: DataFrame, row: Series) -> Tuple[str, str, Optional[str]]:
+    """
+    Aplica uma expressão regular (REGEX) a um campo específico do DataFrame de dados,
+    retornando o percentual de compatibilidade e o detalhe do primeiro erro.
+
+    Args:
+        df_data: DataFrame com os dados a serem analisados.
+        df_fields: DataFrame de campos (mantido na assinatura, mas não utilizado).
+        row: Registro de testes com 'format' (REGEX) e 'field' (nome do campo).
+
+    Returns:
+        Uma tupla contendo: (evidence_msg, status, details)
+    """
+    return _apply_partial(_regex_format_partial, _regex_format_format, df_data, df_fields, row)
+
+def check_zero_values(df_data: DataFrame, df_fields: DataFrame, row: Series) -> Tuple[str, str, Optional[str]]:
+
+    try: 
         # Retorno 5 (Garante o retorno normal)
-        
-        return evidence_msg, status, details   
+        return _apply_partial(_zero_values_partial, _zero_values_format, df_data, df_fields, row)
         
     except Exception as e:
       
@@ -277,59 +488,8 @@ def check_zero_values(df_data: DataFrame, df_fields: DataFrame, row: Series) ->
 def check_negative_values(df_data: DataFrame, df_fields: DataFrame, row: Series) -> Tuple[str, str, Optional[str]]:
 
     try: 
-        # 1. Extrair e Sanitizar os Parâmetros
-        field_name = str(row["field"]).strip()
-        # separar valores numericos e não numericos da coluna 
-        coluna_numerica = pd.to_numeric(
-        df_data[field_name].astype(str).str.replace(',', '.', regex=False), errors='coerce')  # padroniza virgula para separador decimal
-        # Cria a Máscara Booleana de Ruído:
-        # True onde o valor NÃO É NaN (foi convertido com sucesso)
-        mascara_numerico = coluna_numerica.notna()
-        # 3. Cria a Série de Valores que Podem Ser Convertidos (Os Limpos)
-        # Usa o isna() no DataFrame original onde a máscara é True
-        df_valores_numericos = df_data.loc[mascara_numerico, field_name]
-        df_valores_numericos = pd.to_numeric(df_valores_numericos, errors='raise')       
-        # 4. Cria a Série de Valores de Ruído (Os Não Convertíveis)
-        #    Usa o inverso da máscara (~mascara_numerico)
-        df_valores_nao_numericos = df_data.loc[~mascara_numerico, field_name]  
-
-        # 3. Aplicação da Máscara (Valores Iguais a Zero)
-        series_alvo = df_valores_numericos
-        
-        if series_alvo.dtype in ['object', 'string']:
-            evidence_msg = "Não foi possivel validar"
-            status = "error"
-            details = f"ERRO: Coluna '{field_name}' é do tipo {series_alvo.dtype}. Não é ideal para checagem de valores negativos."
-            return evidence_msg, status, details  # Retorno 2 (Em caso de tipo de dado inadequado)
-
-        # 4. Cálculo de Métricas
-        mascara_negativos = (series_alvo < 0)
-        total_linhas = len(df_valores_numericos)
-        negativos_encontrados = mascara_negativos.sum()
-        percentual_negativos = (negativos_encontrados / total_linhas) * 100 if total_linhas > 0 else 0.00
-
-        # 5. Geração de Retorno Padrão
-        evidence_msg = f"Negativos: {percentual_negativos:.2f}%"
-   
-        if percentual_negativos == 0.00:
-            status = "pass"
-            details = "" # Retorno 3 (Sucesso)
-        else:
-            # 6. Falha: Encontrar o Primeiro Erro
-            status = "fail"
-            # Buscando o índice do erro (Pode ser o ponto de falha mais comum)
-            primeiro_negativo_indice = mascara_negativos.idxmax()
-            primeiro_negativo_valor = df_valores_numericos.loc[primeiro_negativo_indice]
-            primeiro_negativo_indice += 2 # Corrige o numero do indice
-
-            details = (
-                f"Linha com exemplo de erro: ({primeiro_negativo_indice}): "
-                f"Valor encontrado: {primeiro_negativo_valor}"
-            )
-
         # Retorno 5 (Garante o retorno normal)
-
-        return evidence_msg, status, details   
+        return _apply_partial(_negative_values_partial, _negative_values_format, df_data, df_fields, row)
         
     except Exception as e:
         evidence_msg = "Erro na rotina de analise."
@@ -342,112 +502,8 @@ def check_negative_values(df_data: DataFrame, df_fields: DataFrame, row: Series)
 def check_valid_range(df_data: DataFrame, df_fields: DataFrame, row: Series) -> Tuple[str, str, Optional[str]]:
 
     try: 
-
-        # 1. Extrair e Sanitizar os Parâmetros
-        field_name = str(row["field"]).strip()
-        field_range = str(row["range"]).strip()
-    
-
-        # separar valores numericos e não numericos da coluna 
-        coluna_numerica = pd.to_numeric(
-        df_data[field_name].astype(str).str.replace(',', '.', regex=False), errors='coerce')  # padroniza virgula para separador decimal
-        # Cria a Máscara Booleana de Ruído:
-        # True onde o valor NÃO É NaN (foi convertido com sucesso)
-        mascara_numerico = coluna_numerica.notna()
-
-        # 3. Cria a Série de Valores que Podem Ser Convertidos (Os Limpos)
-        # Usa o isna() no DataFrame original onde a máscara é True
-        df_valores_numericos = df_data.loc[mascara_numerico, field_name]
-        df_valores_numericos = pd.to_numeric(df_valores_numericos, errors='raise')       
-        # 4. Cria a Série de Valores de Ruído (Os Não Convertíveis)
-        #    Usa o inverso da máscara (~mascara_numerico)
-        df_valores_nao_numericos = df_data.loc[~mascara_numerico, field_name]   
-
-        # Valida o formato do range 
-        # Formato esperado para o range "de x a y", onde x e y são qualquer numero
-        regex_formato = r"^de\s*([\d\.,]+)\s*a\s*([\d\.,]+)$"
-
-        if not re.fullmatch(regex_formato, field_range):
-            evidence_msg = "Não foi possivel validar"
-            details = f"ERRO: O campo '{field_name}' está com erro no formato range. deve ser 'de x a y', onde x w y são numeros."
-            status = "Error"
-            return evidence_msg, status, details
-        
-        # Extrai os ranges 
-        field_range_inicio = None 
-        field_range_fim = None
-
-        regex_intervalo = r"^de\s*([\d\.,]+)\s*a\s*([\d\.,]+)$"
-        match = re.fullmatch(regex_intervalo, field_range, re.IGNORECASE)
-
-        if match:
-            num1_str = match.group(1)
-            num2_str = match.group(2)
-    
-            try:
-                field_range_inicio = float(num1_str.replace('.', '').replace(',', '.'))
-                field_range_fim = float(num2_str.replace('.', '').replace(',', '.'))
-            except ValueError:
-                evidence_msg = "Não foi possivel validar"
-                details = f"ERRO: Não foi possivel extrair os ranges informados no campo '{field_name}'"
-                status = "Error"
-                return evidence_msg, status, details
-
-        print("----------- DEBUG RANGE -----------")
-        print(field_range_inicio)
-        print(field_range_fim)
-
-        print("----------- DEBUG RANGE -----------")
-
-        # 3. Aplicação da Máscara (Valores Iguais a Zero)
-        series_alvo = df_valores_numericos
-        
-        if series_alvo.dtype in ['object', 'string']:
-            evidence_msg = "Não foi possivel validar"
-            status = "fail"
-            details = f"ERRO: Coluna '{field_name}' é do tipo {series_alvo.dtype}. Não é ideal para checagem de valores negativos."
-            return evidence_msg, status, details  # Retorno 2 (Em caso de tipo de dado inadequado)
-
-        # 4. Cálculo de Métricas
-        mascara_range = (series_alvo >= field_range_inicio) & (series_alvo <= field_range_fim)
-        mascara_range_invertida = ~mascara_range
-
-        total_linhas = len(df_valores_numericos)
-        ranges_invalidos_encontrados = mascara_range_invertida.sum()
-        percentual_ranges_invalidos = (ranges_invalidos_encontrados / total_linhas) * 100 if total_linhas > 0 else 0.00
-
-        # 5. Geração de Retorno Padrão
-        evidence_msg = f"fora do range: {percentual_ranges_invalidos:.2f}%"
-   
-        if percentual_ranges_invalidos == 0.00:
-            status = "pass"
-            details = "" # Retorno 3 (Sucesso)
-        else:
-            # 6. Falha: Encontrar o Primeiro Erro
-            status = "fail"
-            # Buscando o índice do erro (Pode ser o ponto de falha mais comum)
-            primeiro_range_invalido_indice = mascara_range_invertida.idxmax()
-
-            # mascara_range_invalido = ~mascara_range  # O til (~) inverte True para False e vice-versa
-            # if mascara_range_invalido.any():
-            #     primeiro_range_invalido_indice = mascara_range_invalido.idxmax()
-            #     primeiro_range_invalido_valor = df_data.loc[primeiro_range_invalido_indice, field_name] 
-
-            primeiro_range_invalido_valor = df_valores_numericos.loc[primeiro_range_invalido_indice]
-
-            print("----------- DEBUG RANGE primeiro_range_invalido_indice -----------")
-            print(primeiro_range_invalido_indice+2)
-
-            print("----------- DEBUG RANGE primeiro_range_invalido_indice -----------")
-
-            details = (
-                f"Linha com exemplo de erro: ({primeiro_range_invalido_indice}): "
-                f"Valor encontrado: {primeiro_range_invalido_valor}"
-            )
-
         # Retorno 5 (Garante o retorno normal)
-
-        return evidence_msg, status, details   
+        return _apply_partial(_valid_range_partial, _valid_range_format, df_data, df_fields, row)
         
     except Exception as e:
 
@@ -455,10 +511,20 @@ def check_valid_range(df_data: DataFrame, df_fields: DataFrame, row: Series) ->
 
         evidence_msg = "Erro de execução da rotina de analise"
         # 7. TRATAMENTO FINAL: Captura QUALQUER exceção não prevista e GARANTE o retorno de 3 valores.
-        details = f"FALHA INESPERADA na rotina check_negative_values: {type(e).__name__}: {str(e)}" "("+ str(exc_tb.tb_lineno) + ")"
+        details = f"FALHA INESPERADA na rotina check_negative_values: {type(e).__name__}: {str(e)}" "("+ str([frame.lineno for frame in traceback.extract_tb(exc_tb) if frame.filename == __file__][-1]) + ")"
         
         # Retorno FINAL, Crítico e Garantido (Retorno 6)
         return evidence_msg, "error", details
 
+# Rotinas de validação com contagem parcial (podem ser executadas por partes do arquivo)
+PARTIAL_CHECKS = {
+    "check_null_empty": (_null_empty_partial, _null_empty_format),
+    "check_regex_format": (_regex_format_partial, _regex_format_format),
+    "check_zero_values": (_zero_values_partial, _zero_values_format),
+    "check_negative_values": (_negative_values_partial, _negative_values_format),
+    "check_valid_range": (_valid_range_partial, _valid_range_format),
+}
+
+
 def check_values_list(df_data: DataFrame, df_fields: DataFrame, row: Series) -> Tuple[str, str, Optional[str]]:
     pass 
\ No newline at end of file
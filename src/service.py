@@ -0,0 +1,357 @@
+# ============================================================
+#  File:        service.py
+#  Author:      Sergio Ribeiro
+#  Description: Serviço de validação (daemon) com monitoramento do diretório de dados
+# ============================================================
+#
+# Mantém em memória as configurações, a lista de checagens por arquivo (montada a
+# partir do eda.xlsx) e os caches das rotinas de analise, validando os arquivos
+# conforme chegam no diretório de dados ou são solicitados por socket local.
+#
+# Uso (a partir da raiz do projeto):
+#   python -m src.service                      monitora o data_path do config.json
+#   python -m src.service --port 8765          também aceita jobs via socket
+#   python -m src.service --no-watch --port 8765
+#   python -m src.service --parallel-min-mb 64  arquivos a partir de 64 MB validados em paralelo
+#
+# Protocolo do socket: uma linha JSON por job, ex: {"file": "Ses_seguros.csv"}
+# A resposta é uma linha JSON com os resultados: {"file": ..., "results": [...]}
+import argparse
+import datetime
+import json
+import os
+import socketserver
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+import pandas as pd
+
+import src.analisys
+from src.analisys import build_checks, check_structure, save_result, validate_file_parallel
+from src.utilities import logger
+from src.utilities import load_config, load_eda_config, load_data, prepare_data, init_log
+
+# Arquivos a partir deste tamanho são validados em paralelo, por faixas de bytes (256 MB)
+PARALLEL_MIN_SIZE = 256 * 1024 * 1024
+
+# Estado do serviço (mantido entre as validações)
+_STATE: Dict[str, Any] = {
+    "config": None,        # parametros do config.json
+    "eda_path": None,      # caminho do eda.xlsx
+    "eda_mtime": None,     # data de modificação do eda.xlsx carregado
+    "validations": None,   # aba 'validations'
+    "fields": None,        # aba 'fields'
+    "checks": {},          # nome do arquivo (minusculo) -> lista (campo, checagem)
+    "seen": {},            # caminho do arquivo -> (mtime, tamanho) da ultima validação
+    "parallel_min_size": PARALLEL_MIN_SIZE,  # tamanho minimo (bytes) para validar em paralelo
+    "max_workers": None,   # processos da validação paralela (None: numero de CPUs)
+    "failures": {},        # evento -> ultima falha registrada (evita repetir no log a cada ciclo)
+    "lock": threading.Lock(),
+}
+
+# Colunas exibidas no relatório
+COLUNAS_EXIBICAO = ['status', 'file', 'Field', 'test', 'evidence', 'detail']
+
+
+# Rotinas auxiliares
+
+def _file_signature(file_path: str) -> Tuple[int, int]:
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _log_failure(routine: str, event: str, message: str):
+    # Registra a falha no log somente se for diferente da ultima falha do mesmo evento
+    if _STATE["failures"].get(event) != message:
+        _STATE["failures"][event] = message
+        logger.log_event(routine, event, message, "fail")
+
+
+def load_rules(force: bool = False) -> bool:
+    """
+    Carrega (ou recarrega) as validações e os campos do eda.xlsx e monta a lista de
+    checagens de cada arquivo. A leitura só é refeita se o eda.xlsx foi modificado.
+
+    Args:
+        force: Recarrega mesmo que o arquivo não tenha sido modificado.
+
+    Returns:
+        True se as regras foram recarregadas.
+    """
+    eda_path = _STATE["eda_path"]
+    try:
+        mtime = os.stat(eda_path).st_mtime_ns
+        if not force and mtime == _STATE["eda_mtime"]:
+            return False
+        df_validations, df_fields = load_eda_config(pd.DataFrame([{}]), pd.DataFrame([{}]), eda_path)
+    except Exception as e:
+        # Mantém as regras anteriores (ex: planilha sendo salva ou removida) e tenta de
+        # novo no proximo ciclo
+        _log_failure("load_rules", "RULES_FAILED", f"{type(e).__name__}: {str(e)}")
+        if _STATE["validations"] is None:
+            raise
+        return False
+    _STATE["failures"].pop("RULES_FAILED", None)
+
+    # Converte todos os campos para str e deixa os nomes das colunas em minusculo
+    df_fields = df_fields.astype('string')
+    df_fields.columns = df_fields.columns.str.strip().str.lower()
+
+    checks = {}
+    for file_name, df_file_fields in df_fields.groupby(df_fields["file"].str.strip().str.lower()):
+        checks[file_name] = build_checks(df_file_fields, df_validations)
+
+    _STATE.update({"eda_mtime": mtime, "validations": df_validations, "fields": df_fields, "checks": checks})
+    logger.log_event("load_rules", "RULES_LOADED", f"{len(checks)} arquivo(s) configurado(s) em {eda_path}", "info")
+    return True
+
+
+def validate_file(file_path: str, file_checks: List[Tuple[pd.Series, pd.Series]], df_fields: pd.DataFrame,
+                  separator: str, encode: str, parallel_min_size: Optional[int] = None,
+                  max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Valida um arquivo de dados: informações de estrutura (tamanho, colunas faltantes e
+    duplicadas) e as checagens configuradas para cada campo. Arquivos a partir de
+    parallel_min_size bytes são validados em paralelo, por faixas de bytes
+    (validate_file_parallel), sem carregar o arquivo inteiro em memória.
+
+    Args:
+        file_path: Caminho do arquivo de dados.
+        file_checks: Lista (campo, checagem) do arquivo, montada por load_rules.
+        df_fields: Campos configurados (aba 'fields').
+        separator: Separador de campos.
+        encode: Encode do arquivo (vazio para detectar).
+        parallel_min_size: Tamanho minimo (bytes) para a validação paralela (None: nunca).
+        max_workers: Quantidade de processos da validação paralela (padrão: numero de CPUs).
+
+    Returns:
+        A lista de resultados no formato do relatório.
+    """
+    file_name = os.path.basename(file_path)
+
+    try:
+        if parallel_min_size is not None and os.path.getsize(file_path) >= parallel_min_size:
+            return validate_file_parallel(file_path, df_fields, None, separator, encode,
+                                          max_workers=max_workers, checks=file_checks)
+        df_data = load_data(pd.DataFrame([{}]), file_path, separator, encode)
+    except Exception as e:
+        return [save_result(file_name, "Todos", "structure", "file info", "Falha no carregamento do arquivo",
+                            f"{type(e).__name__}: {str(e)}", "error")]
+
+    df_data = prepare_data(df_data)
+
+    # Informações de estrutura (tamanho, colunas faltantes e duplicadas)
+    results = check_structure(file_path, len(df_data), df_data.columns.to_list(), df_fields)
+
+    # Loop de chamada das analises
+    for row, check_row in file_checks:
+        if str(row["field"]).strip().lower() not in df_data.columns:  # ignora colunas que não foram encontradas
+            continue
+        try:
+            #  chama a rotina parametrizada para a analise
+            evidence, status, detail = getattr(src.analisys, check_row["routine"])(df_data, df_fields, row)
+        except Exception as e:
+            evidence = "Falha na chamada da rotina de analise"
+            status = "error"
+            detail = f"Rotina '{check_row['routine']}': {type(e).__name__}: {str(e)}"
+        results.append(save_result(row["file"], row["field"], check_row["category"], check_row["test"], evidence, detail, status))
+
+    # Libera o perfil estatistico do arquivo
+    src.analisys.clear_profile_cache()
+
+    return results
+
+
+def _report(results: List[Dict[str, Any]], file_path: str):
+    # Exibe os resultados e grava o relatório (csv) no diretório do log
+    df_results = pd.DataFrame(results, columns=["file", "Field", "category", "test", "evidence", "detail", "status"])
+    print("\n" + "=" * 80)
+    print(f"--- 📋 REGISTROS DE AUDITORIA: {os.path.basename(file_path)} ---".center(80))
+    print("=" * 80)
+    print(df_results[COLUNAS_EXIBICAO].to_string(justify='left'))
+
+    nome = datetime.datetime.now().strftime("%Y%m%d %H-%M-%S") + " " + os.path.splitext(os.path.basename(file_path))[0] + " results.csv"
+    df_results.to_csv(os.path.join(logger.LOG_PATH, nome), sep=";", index=False, encoding="utf-8")
+
+
+def run_job(file_path: str) -> List[Dict[str, Any]]:
+    """
+    Valida um arquivo com as regras em memória (recarregadas se o eda.xlsx mudou).
+
+    Args:
+        file_path: Caminho do arquivo (absoluto ou relativo ao data_path).
+
+    Returns:
+        A lista de resultados no formato do relatório.
+    """
+    config = _STATE["config"]
+    if not os.path.isabs(file_path):
+        file_path = os.path.join(config["data_path"], file_path)
+
+    with _STATE["lock"]:
+        load_rules()
+        file_checks = _STATE["checks"].get(os.path.basename(file_path).strip().lower())
+        if file_checks is None:
+            logger.log_event("run_job", "FILE_NOT_CONFIGURED", file_path, "fail")
+            return [save_result(os.path.basename(file_path), "Todos", "structure", "file info",
+                                 "Arquivo não configurado", "Arquivo não encontrado na aba 'fields' do eda.xlsx.", "error")]
+
+        inicio = time.perf_counter()
+        signature = _file_signature(file_path)
+        results = validate_file(file_path, file_checks, _STATE["fields"], config["separator"], config["encode"],
+                                _STATE["parallel_min_size"], _STATE["max_workers"])
+        _STATE["seen"][file_path] = signature
+
+        logger.log_event("run_job", "FILE_VALIDATED", f"{file_path} ({time.perf_counter() - inicio:.2f}s)", "info")
+        _report(results, file_path)
+
+    return results
+
+
+# Monitoramento do diretório e socket
+
+def _scan(data_path: str) -> Dict[str, Tuple[int, int]]:
+    # Arquivos configurados no eda.xlsx presentes no diretório de dados
+    arquivos = {}
+    try:
+        with os.scandir(data_path) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.strip().lower() in _STATE["checks"]:
+                    stat = entry.stat()
+                    arquivos[entry.path] = (stat.st_mtime_ns, stat.st_size)
+    except OSError as e:
+        # Diretório indisponivel (ex: removido ou desmontado): tenta de novo no proximo ciclo
+        _log_failure("_scan", "SCAN_FAILED", f"{data_path}: {type(e).__name__}: {str(e)}")
+        return {}
+    _STATE["failures"].pop("SCAN_FAILED", None)
+    return arquivos
+
+
+def watch(data_path: str, interval: float, validate_existing: bool = False):
+    """
+    Monitora o diretório de dados e valida os arquivos novos ou modificados. Um arquivo
+    só é validado quando sua data e tamanho se repetem em duas varreduras seguidas
+    (evita validar um arquivo que ainda está sendo copiado).
+
+    Args:
+        data_path: Diretório de dados.
+        interval: Intervalo entre as varreduras (segundos).
+        validate_existing: Valida também os arquivos já presentes ao iniciar.
+    """
+    # Os arquivos da varredura vêm com o caminho absoluto (não relativo ao data_path)
+    data_path = os.path.abspath(data_path)
+    if not validate_existing:
+        _STATE["seen"].update(_scan(data_path))
+
+    logger.log_event("watch", "WATCH_STARTED", data_path, "info")
+    pending = {}
+    while True:
+        try:
+            with _STATE["lock"]:
+                load_rules()
+            for file_path, signature in _scan(data_path).items():
+                if _STATE["seen"].get(file_path) == signature:
+                    continue
+                if pending.get(file_path) != signature:
+                    pending[file_path] = signature
+                    continue
+                pending.pop(file_path)
+                try:
+                    run_job(file_path)
+                except Exception as e:
+                    # So tenta de novo quando o arquivo for modificado
+                    _STATE["seen"][file_path] = signature
+                    _log_failure("watch", "JOB_FAILED", f"{file_path}: {type(e).__name__}: {str(e)}")
+        except Exception as e:
+            # Uma falha no ciclo não interrompe o monitoramento
+            _log_failure("watch", "WATCH_FAILED", f"{type(e).__name__}: {str(e)}")
+        time.sleep(interval)
+
+
+class _JobHandler(socketserver.StreamRequestHandler):
+    # Recebe uma linha JSON por job e responde com uma linha JSON
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                job = json.loads(line)
+                results = run_job(job["file"])
+                resposta = {"file": job["file"], "results": results}
+            except Exception as e:
+                resposta = {"error": f"{type(e).__name__}: {str(e)}"}
+            self.wfile.write((json.dumps(resposta, ensure_ascii=False, default=str) + "\n").encode("utf-8"))
+
+
+def serve_socket(port: int) -> socketserver.ThreadingTCPServer:
+    """Inicia o servidor de jobs em 127.0.0.1 (em uma thread) e retorna o servidor."""
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", port), _JobHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    logger.log_event("serve_socket", "SOCKET_STARTED", f"127.0.0.1:{server.server_address[1]}", "info")
+    return server
+
+
+def start(data_path: Optional[str] = None, eda_config_path: Optional[str] = None, log_path: Optional[str] = None):
+    """
+    Carrega as configurações gerais, inicia o log e carrega as regras do eda.xlsx.
+
+    Args:
+        data_path: Diretório de dados (padrão: data_path do config.json).
+        eda_config_path: Caminho do eda.xlsx (padrão: eda_config_path do config.json).
+        log_path: Diretório do log e dos relatórios (padrão: log_path do config.json).
+    """
+    df_config = pd.DataFrame([{}])
+    load_config(df_config)
+    config = df_config.loc[0].to_dict()
+    if data_path:
+        config["data_path"] = data_path
+    if eda_config_path:
+        config["eda_config_path"] = eda_config_path
+    if log_path:
+        config["log_path"] = log_path
+    # Caminho absoluto: os arquivos encontrados na varredura já incluem o diretório
+    config["data_path"] = os.path.abspath(config["data_path"])
+
+    init_log(config["log_path"])
+    _STATE.update({"config": config, "eda_path": config["eda_config_path"], "eda_mtime": None, "seen": {}})
+    load_rules(force=True)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="eda-o-matic: serviço de validação")
+    parser.add_argument("--data-path", help="diretório de dados (padrão: data_path do config.json)")
+    parser.add_argument("--eda-config", help="caminho do eda.xlsx (padrão: eda_config_path do config.json)")
+    parser.add_argument("--log-path", help="diretório do log e dos relatórios (padrão: log_path do config.json)")
+    parser.add_argument("--interval", type=float, default=0.5, help="intervalo entre varreduras do diretório, em segundos")
+    parser.add_argument("--port", type=int, default=None, help="porta local para receber jobs via socket")
+    parser.add_argument("--no-watch", action="store_true", help="não monitora o diretório de dados")
+    parser.add_argument("--validate-existing", action="store_true", help="valida os arquivos já existentes ao iniciar")
+    parser.add_argument("--parallel-min-mb", type=float, default=PARALLEL_MIN_SIZE / (1024 * 1024),
+                        help="tamanho minimo (MB) para validar o arquivo em paralelo, por faixas de bytes")
+    parser.add_argument("--no-parallel", action="store_true", help="valida todos os arquivos em um unico processo")
+    parser.add_argument("--workers", type=int, default=None, help="processos da validação paralela (padrão: numero de CPUs)")
+    args = parser.parse_args(argv)
+
+    if args.no_watch and args.port is None:
+        parser.error("informe --port quando usar --no-watch")
+
+    start(args.data_path, args.eda_config, args.log_path)
+    _STATE["parallel_min_size"] = None if args.no_parallel else int(args.parallel_min_mb * 1024 * 1024)
+    _STATE["max_workers"] = args.workers
+
+    if args.port is not None:
+        serve_socket(args.port)
+
+    try:
+        if args.no_watch:
+            threading.Event().wait()
+        else:
+            watch(_STATE["config"]["data_path"], args.interval, args.validate_existing)
+    except KeyboardInterrupt:
+        logger.log_event("main", "SERVICE_STOPPED", "", "info")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,15 @@ from .logger import log_event, LOG_FILE, LOG_PATH
 from .utilities import load_config
 from .utilities import load_validations
 from .utilities import load_fields
+from .utilities import load_eda_config
 from .utilities import load_data
+from .utilities import prepare_data
 from .utilities import init_log
 from .utilities import format_file_size
+from .utilities import detect_encoding
+from .splitter import split_byte_ranges
+from .splitter import read_byte_range
 
 
-__all__ = ["log_event", "LOG_FILE", "LOG_PATH", "load_config", "load_validations", "load_fields", "load_data",  "init_log", "format_file_size"]
+__all__ = ["log_event", "LOG_FILE", "LOG_PATH", "load_config", "load_validations", "load_fields", "load_eda_config", "load_data", "prepare_data", "init_log", "format_file_size",
+           "detect_encoding", "split_byte_ranges", "read_byte_range"]
@@ -20,33 +20,48 @@ def _load_config_json():
     except FileNotFoundError:
         raise FileNotFoundError(f"O arquivo de configuração não foi encontrado em: {CONFIG_JSON_FILE}")
         
-# Carrega a configuração uma única vez ao iniciar o módulo
-_DADOS_CONFIG = _load_config_json()
+# Carrega a configuração somente no primeiro acesso a um parametro (e uma única vez),
+# para que importar o modulo não dependa do config.json nem pague a leitura
+_DADOS_CONFIG = None
+
+def _get_config():
+    global _DADOS_CONFIG
+    if _DADOS_CONFIG is None:
+        _DADOS_CONFIG = _load_config_json()
+    return _DADOS_CONFIG
 
 # -----------------------------------------------------------------
 # Cria variaveis pra compartilhar os parametros no projeto todo
 # -----------------------------------------------------------------
 
-# Parâmetros lidos do JSON
-DATA_PATH = _DADOS_CONFIG.get("data_path")
-EDA_CONFIG_PATH = _DADOS_CONFIG.get("eda_config_path")
-FILE_FORMAT = _DADOS_CONFIG.get("file_format")
-SEPARATOR = _DADOS_CONFIG.get("separator")
-DECIMAL_SEPARATOR = _DADOS_CONFIG.get("decimal_separator")
-DATE_FORMAT = _DADOS_CONFIG.get("date_format")
-LOG_PATH = _DADOS_CONFIG.get("log_path")
+# Parâmetros lidos do JSON (nome da variavel -> chave no config.json)
+_PARAMETROS_JSON = {
+    "DATA_PATH": "data_path",
+    "EDA_CONFIG_PATH": "eda_config_path",
+    "FILE_FORMAT": "file_format",
+    "SEPARATOR": "separator",
+    "DECIMAL_SEPARATOR": "decimal_separator",
+    "DATE_FORMAT": "date_format",
+    "LOG_PATH": "log_path",
+}
+
+def __getattr__(name):
+    if name in _PARAMETROS_JSON:
+        return _get_config().get(_PARAMETROS_JSON[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Outros parametros
 MAIN_PATH = Path.cwd().parent.parent.parent
 
 # Lista de caminhos e parâmetros disponíveis para importação em outros módulos
 __all__ = [
 # Parâmetros lidos do JSON
-DATA_PATH, 
-EDA_CONFIG_PATH, 
-FILE_FORMAT, 
-SEPARATOR,
-DECIMAL_SEPARATOR, 
-DATE_FORMAT, 
-LOG_PATH,
-MAIN_PATH
+"DATA_PATH", 
+"EDA_CONFIG_PATH", 
+"FILE_FORMAT", 
+"SEPARATOR",
+"DECIMAL_SEPARATOR", 
+"DATE_FORMAT", 
+"LOG_PATH",
+"MAIN_PATH"
 ]
\ No newline at end of file
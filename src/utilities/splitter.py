@@ -0,0 +1,131 @@
+# ============================================================
+#  File:        splitter.py
+#  Author:      Sergio Ribeiro
+#  Description: Divisão de arquivos CSV em faixas de bytes
+# ============================================================
+import io
+import os
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+
+# Tamanho do bloco lido na varredura do arquivo (16 MB)
+BLOCK_SIZE = 16 * 1024 * 1024
+
+
+def split_byte_ranges(file_path: str, n_parts: int, quotechar: str = '"') -> Tuple[int, List[Tuple[int, int]]]:
+    """
+    Divide um arquivo CSV em faixas de bytes alinhadas ao fim dos registros, para que
+    cada faixa possa ser lida de forma independente (ex: em processos separados).
+
+    O arquivo é varrido uma única vez contando as aspas, de modo que uma quebra de
+    linha dentro de um campo entre aspas nunca é usada como limite de faixa. A
+    varredura usa apenas bytes.find/bytes.count e para assim que o ultimo limite é
+    encontrado. Supõe um encode em que b'\\n' e as aspas não aparecem dentro de outros
+    caracteres (utf-8, latin-1, cp1252).
+
+    Args:
+        file_path: Caminho do arquivo CSV.
+        n_parts: Quantidade desejada de faixas.
+        quotechar: Caractere de aspas do CSV (vazio para ignorar aspas).
+
+    Returns:
+        Uma tupla contendo: (fim do cabeçalho, lista de faixas (inicio, fim))
+        As faixas cobrem o arquivo inteiro após o cabeçalho, sem sobreposição.
+    """
+    file_size = os.path.getsize(file_path)
+    quote = quotechar.encode() if quotechar else b""
+
+    header_end = None
+    targets = []            # posições alvo (aproximadas) dos limites das faixas
+    boundaries = []         # limites encontrados (inicio de um registro)
+    seek = 0                # posição a partir da qual se procura o proximo fim de registro
+    block_start = 0
+    in_quotes = False       # estado das aspas no inicio do bloco
+
+    with open(file_path, "rb") as f:
+        while seek < file_size:
+            block = f.read(BLOCK_SIZE)
+            if not block:
+                break
+            block_end = block_start + len(block)
+
+            while seek < block_end:
+                local = seek - block_start
+                # Estado das aspas na posição de busca
+                parity = in_quotes ^ bool(quote and block.count(quote, 0, local) & 1)
+
+                # Procura a primeira quebra de linha fora de aspas
+                nl = block.find(b"\n", local)
+                while nl != -1:
+                    if quote:
+                        parity ^= bool(block.count(quote, local, nl) & 1)
+                    if not parity:
+                        break
+                    local = nl + 1
+                    nl = block.find(b"\n", local)
+
+                if nl == -1:
+                    # Continua a busca no proximo bloco
+                    seek = block_end
+                    break
+
+                boundary = block_start + nl + 1
+                if header_end is None:
+                    # Primeiro registro é o cabeçalho: distribui o restante do arquivo
+                    header_end = boundary
+                    step = (file_size - header_end) / max(n_parts, 1)
+                    targets = [header_end + int(step * i) for i in range(1, max(n_parts, 1))]
+                else:
+                    boundaries.append(boundary)
+
+                # Descarta os alvos já ultrapassados (ex: campo entre aspas muito longo)
+                targets = [t for t in targets if t > boundary]
+                seek = targets.pop(0) if targets else file_size
+
+            if quote:
+                in_quotes ^= bool(block.count(quote) & 1)
+            block_start = block_end
+
+    if header_end is None:
+        # Arquivo sem quebra de linha: apenas cabeçalho
+        return file_size, []
+
+    limits = [header_end] + [b for b in boundaries if b < file_size] + [file_size]
+    ranges = [(start, end) for start, end in zip(limits[:-1], limits[1:]) if end > start]
+
+    return header_end, ranges
+
+
+def read_byte_range(file_path: str, header_end: int, start: int, end: int, separator: str, encoding: str,
+                    dtype: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Lê uma faixa de bytes do arquivo CSV como DataFrame, usando o cabeçalho do arquivo.
+
+    O cabeçalho é lido junto com a faixa para que os nomes de colunas (inclusive os
+    duplicados, renomeados pelo pandas) fiquem iguais aos da leitura do arquivo inteiro.
+    O indice do DataFrame é relativo ao inicio da faixa.
+
+    Args:
+        file_path: Caminho do arquivo CSV.
+        header_end: Posição do fim do cabeçalho (retornada por split_byte_ranges).
+        start: Inicio da faixa (em bytes).
+        end: Fim da faixa (em bytes, exclusivo).
+        separator: Separador de campos.
+        encoding: Encode do arquivo.
+        dtype: Tipos forçados por coluna (nomes do cabeçalho), repassados ao read_csv.
+
+    Returns:
+        O DataFrame com os registros da faixa.
+    """
+    with open(file_path, "rb") as f:
+        buffer = f.read(header_end)
+        f.seek(start)
+        buffer += f.read(end - start)
+
+    return pd.read_csv(
+        io.BytesIO(buffer),
+        encoding=encoding,
+        sep=separator,
+        dtype=dtype,
+        engine='python'
+    )
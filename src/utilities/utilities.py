@@ -8,8 +8,8 @@ import os
 from pathlib import Path
 from src.utilities import logger
 import pandas as pd
-from charset_normalizer import from_path 
-from typing import Union
+from charset_normalizer import from_bytes, from_path 
+from typing import Dict, Optional, Tuple, Union
 
 # Carrega as configurações gerais 
 def load_config(df_config: pd.DataFrame):
@@ -68,17 +68,78 @@ def load_fields(df_fields: pd.DataFrame, excel_path: str):
     return df_fields
 
 
-def load_data(df_data: pd.DataFrame, file_path: str, separator: str, encode: str):
+def load_eda_config(df_validations: pd.DataFrame, df_fields: pd.DataFrame, excel_path: str):
+    # Lê as abas 'validations' e 'fields' abrindo o Excel uma única vez
+    # Verifica se o arquivo existe
+    if not os.path.exists(excel_path):
+        raise FileNotFoundError(f"Arquivo Excel não encontrado: {excel_path}")
 
+    abas = pd.read_excel(excel_path, sheet_name=["validations", "fields"])
+
+    # Limpa os dataframes originais e substitui os dados
+    for df_destino, df_temp in ((df_validations, abas["validations"]), (df_fields, abas["fields"])):
+        df_destino.drop(df_destino.index, inplace=True)
+        for col in df_temp.columns:
+            df_destino[col] = df_temp[col]
+
+    return df_validations, df_fields
+
+
+# Tamanho de cada bloco (inicio, meio e fim do arquivo) usado na detecção do encode
+# por amostra (1 MB)
+ENCODING_SAMPLE_SIZE = 1024 * 1024
+
+
+def _encoding_sample(file_path: str) -> Tuple[bytes, bool]:
+    # ----------------------------------------------------------------------------------
+    # Lê blocos do inicio, do meio e do fim do arquivo, cortados nas quebras de linha
+    # para não partir um caractere multibyte. Retorna a amostra e se ela é o arquivo
+    # inteiro.
+    # ----------------------------------------------------------------------------------
+    file_size = os.path.getsize(file_path)
+    if file_size <= 3 * ENCODING_SAMPLE_SIZE:
+        with open(file_path, "rb") as f:
+            return f.read(), True
+
+    blocos = []
+    with open(file_path, "rb") as f:
+        for inicio in (0, (file_size - ENCODING_SAMPLE_SIZE) // 2, file_size - ENCODING_SAMPLE_SIZE):
+            f.seek(inicio)
+            bloco = f.read(ENCODING_SAMPLE_SIZE)
+            if inicio > 0 and b"\n" in bloco:
+                bloco = bloco[bloco.find(b"\n") + 1:]
+            if inicio + ENCODING_SAMPLE_SIZE < file_size and b"\n" in bloco:
+                bloco = bloco[:bloco.rfind(b"\n") + 1]
+            blocos.append(bloco)
+    return b"".join(blocos), False
+
+
+# Detecta o encode do arquivo, se não foi fornecido
+# Com sample=True detecta por amostras do arquivo (não lê o arquivo inteiro)
+def detect_encoding(file_path: str, encode: str, sample: bool = False) -> str:
     try:
-        try:
-            if len(encode) == 0: 
+        if len(encode) == 0: 
+            if sample:
+                amostra, arquivo_inteiro = _encoding_sample(file_path)
+                encoding_detectado = from_bytes(amostra).best().encoding
+                # Uma amostra so com ascii não garante o restante do arquivo (ex: nomes
+                # acentuados fora dos blocos lidos): usa o superconjunto do ascii
+                if encoding_detectado == "ascii" and not arquivo_inteiro:
+                    encoding_detectado = "cp1252"
+            else:
                 detectado = from_path(str(file_path)).best() 
                 encoding_detectado = detectado.encoding 
-            else: 
-                encoding_detectado = encode
-        except Exception:
-            encoding_detectado = 'utf-8' 
+        else: 
+            encoding_detectado = encode
+    except Exception:
+        encoding_detectado = 'utf-8' 
+    return encoding_detectado
+
+
+def load_data(df_data: pd.DataFrame, file_path: str, separator: str, encode: str):
+
+    try:
+        encoding_detectado = detect_encoding(file_path, encode)
 
         df_temp = pd.read_csv(
             file_path,
@@ -103,6 +164,23 @@ def load_data(df_data: pd.DataFrame, file_path: str, separator: str, encode: str
     return df_data
 
 
+# Sanitiza o DataFrame carregado (mesma preparação do notebook)
+def prepare_data(df_data: pd.DataFrame, dtypes: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    # Deixa todos os nomes de campos em minusculo e remove espaços
+    df_data.columns = df_data.columns.str.strip().str.lower()
+    if dtypes is not None:
+        # Aplica os tipos informados (ex: tipos do arquivo inteiro na leitura por faixas)
+        for col, dtype in dtypes.items():
+            if col in df_data.columns and str(df_data[col].dtype) != dtype:
+                df_data[col] = df_data[col].astype(dtype)
+        return df_data
+    # Corrige o tipo das colunas "int" exibidas como "float"
+    for col in df_data.select_dtypes(include=["float"]).columns:
+        if (df_data[col].dropna() % 1 == 0).all():
+            df_data[col] = df_data[col].astype("Int64")
+    return df_data
+
+
 def format_file_size(file_size_bytes: Union[int, float]) -> str:
     """
     Converte um tamanho de arquivo em bytes para uma string legível 